@@ -96,6 +96,31 @@ from .task_configs import get_all_task_configs
     help="""The device to prefer when evaluating the model. If the device is not
     available then another device will be used.""",
 )
+@click.option(
+    "--mixed-precision",
+    is_flag=True,
+    show_default=True,
+    help="""Whether to run the model in mixed precision, using bfloat16 where it is
+    supported and float16 otherwise. Not supported on MPS devices.""",
+)
+@click.option(
+    "--spacy-num-processes",
+    type=int,
+    default=1,
+    show_default=True,
+    help="""The number of processes used to apply spaCy models. Using more than one
+    process is only suitable for spaCy models running on the CPU without a
+    transformer component.""",
+)
+@click.option(
+    "--dataloader-num-workers",
+    type=int,
+    default=0,
+    show_default=True,
+    help="""The number of background workers used to collate the batches when
+    evaluating PyTorch models. If 0 then the batches are collated in the main
+    process.""",
+)
 @click.option(
     "--architecture-fname",
     type=str,
@@ -131,6 +156,9 @@ def evaluate(
     raise_error_on_invalid_model: bool,
     cache_dir: str,
     prefer_device: str,
+    mixed_precision: bool,
+    spacy_num_processes: int,
+    dataloader_num_workers: int,
     architecture_fname: str,
     weight_fname: str,
     verbose: bool,
@@ -166,6 +194,9 @@ def evaluate(
         track_carbon_emissions=track_carbon_emissions,
         country_code=CountryCode(country_code.lower()),
         prefer_device=Device(prefer_device.lower()),
+        mixed_precision=mixed_precision,
+        spacy_num_processes=spacy_num_processes,
+        dataloader_num_workers=dataloader_num_workers,
         architecture_fname=architecture_fname_or_none,
         weight_fname=weight_fname_or_none,
         verbose=verbose,
@@ -1,31 +1,65 @@
 """Configuration dataclasses."""
 
-from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Union
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from itertools import chain, repeat
+from types import MappingProxyType
+from typing import Any
 
 from .enums import CountryCode, Device, Framework, Modality
 from .utils import get_available_devices
 
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class LabelConfig:
     """Configuration for a label in a dataset task.
 
+    Labels are compared and hashed by identity, as each label is only constructed
+    once in the task configurations and then reused.
+
     Attributes:
         name (str):
             The name of the label.
-        synonyms (list of str):
+        synonyms (tuple of str):
             The synonyms of the label.
     """
 
+    # We cannot use `dataclass(slots=True)` as that requires Python 3.10+
+    __slots__ = ("name", "synonyms")
+
     name: str
-    synonyms: List[str]
+    synonyms: tuple[str, ...]
 
+    def __post_init__(self):
+        # Intern the label strings, as they are used as keys in the label conversion
+        # dictionaries and are shared across all the tasks using the label
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(
+            self, "synonyms", tuple(sys.intern(synonym) for synonym in self.synonyms)
+        )
 
-@dataclass
+    def __getstate__(self) -> tuple[str, tuple[str, ...]]:
+        return self.name, self.synonyms
+
+    def __setstate__(self, state: tuple[str, tuple[str, ...]]) -> None:
+        # The default slot restoration uses `setattr`, which is blocked on frozen
+        # dataclasses, so we restore the slots manually when copying or unpickling
+        name, synonyms = state
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "synonyms", synonyms)
+
+
+@dataclass(frozen=True, eq=False)
 class MetricConfig:
     """Configuration for a metric.
 
+    Metrics are compared and hashed by identity, as each metric is only constructed
+    once in the metric configurations and then reused.
+
     Attributes:
         name (str):
             The name of the metric.
@@ -41,7 +75,7 @@ class MetricConfig:
             A function that is applied to the metric scores after they are extracted
             from the results dictionary. Must take a single float as input and return
             a single string.
-        compute_kwargs (dict, optional):
+        compute_kwargs (mapping, optional):
             Keyword arguments to pass to the metric's compute function. Defaults to
             an empty dictionary.
     """
@@ -51,10 +85,10 @@ class MetricConfig:
     huggingface_id: str
     results_key: str
     postprocessing_fn: Callable[[float], str]
-    compute_kwargs: Dict[str, Any] = field(default_factory=dict)
+    compute_kwargs: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True)
 class TaskConfig:
     """Configuration for a task dataset.
 
@@ -73,66 +107,88 @@ class TaskConfig:
             The supertask of the task, describing the overall type of task.
         modality (Modality):
             The modality of the input data.
-        metrics (sequence of MetricConfig objects):
+        metrics (tuple of MetricConfig objects):
             The metrics used to evaluate the task.
-        labels (sequence of LabelConfig objects):
+        labels (tuple of LabelConfig objects):
             The labels used in the task.
-        feature_column_names (list of str):
+        feature_column_names (tuple of str):
             The names of the feature columns for the dataset.
         label_column_name (str):
             The name of the label column for the dataset.
         test_name (str or None):
             The name of the test split of the task. If None, the task has no test
             split.
-        id2label (list of str):
+        id2label (tuple of str):
             The mapping from ID to label.
-        label2id (dict of str to int):
-            The mapping from label to ID. This includes all label synonyms as well.
+        label2id (mapping of str to int):
+            The read-only mapping from label to ID. This includes all label synonyms
+            as well.
         num_labels (int):
             The number of labels in the dataset.
-        label_synonyms (list of list of str):
+        label_synonyms (tuple of tuple of str):
             The synonyms of all the labels, including the main label.
-        architectures (None or list of str):
+        architectures (None or tuple of str):
             The architectures that can be used to solve the task. If None then
-            it defaults to the list containing only the name of the supertaks. Defaults
-            to None.
+            it defaults to the tuple containing only the name of the supertask.
+            Defaults to None.
     """
 
     name: str
     huggingface_id: str
-    huggingface_subset: Optional[str]
+    huggingface_subset: str | None
     supertask: str
     modality: Modality
-    metrics: List[MetricConfig]
-    labels: List[LabelConfig]
-    feature_column_names: List[str]
+    metrics: tuple[MetricConfig, ...]
+    labels: tuple[LabelConfig, ...]
+    feature_column_names: tuple[str, ...]
     label_column_name: str
-    test_name: Optional[str]
-    architectures: Optional[List[str]] = None
+    test_name: str | None
+    architectures: tuple[str, ...] | None = None
+    num_labels: int = field(init=False, repr=False, compare=False)
+    _id2label: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _label2id: Mapping[str, int] = field(init=False, repr=False, compare=False)
+    _label_synonyms: tuple[tuple[str, ...], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # Set the architectures to the supertask if they have not been specified. As
+        # the config is frozen we have to bypass `__setattr__` to do this
+        if self.architectures is None:
+            object.__setattr__(self, "architectures", (self.supertask,))
+
+        # Precompute the label conversions, as the labels never change after the
+        # config has been created. These are cached on the labels themselves, so
+        # configs sharing the same labels also share the conversions
+        object.__setattr__(self, "_id2label", get_id2label(labels=self.labels))
+        object.__setattr__(self, "_label2id", get_label2id(labels=self.labels))
+        object.__setattr__(self, "num_labels", len(self._id2label))
+        object.__setattr__(
+            self, "_label_synonyms", get_label_synonyms(labels=self.labels)
+        )
+
+    def __reduce__(self) -> tuple[type, tuple]:
+        # The label conversions are read-only mappings, which cannot be copied or
+        # pickled, so we rebuild the config from its arguments instead, which
+        # recomputes the label conversions
+        init_args = tuple(getattr(self, fld.name) for fld in fields(self) if fld.init)
+        return type(self), init_args
 
     @property
     def pretty_name(self) -> str:
         return self.name.replace("-", " ")
 
     @property
-    def id2label(self) -> List[str]:
-        return [label.name for label in self.labels]
+    def id2label(self) -> tuple[str, ...]:
+        return self._id2label
 
     @property
-    def label2id(self) -> Dict[str, int]:
-        return {
-            syn: idx
-            for idx, label in enumerate(self.labels)
-            for syn in [label.name] + label.synonyms
-        }
+    def label2id(self) -> Mapping[str, int]:
+        return self._label2id
 
     @property
-    def num_labels(self) -> int:
-        return len(self.labels)
-
-    @property
-    def label_synonyms(self) -> List[List[str]]:
-        return [[label.name] + label.synonyms for label in self.labels]
+    def label_synonyms(self) -> tuple[tuple[str, ...], ...]:
+        return self._label_synonyms
 
 
 @dataclass
@@ -172,6 +228,22 @@ class EvaluationConfig:
             Defaults to "cuda".
         only_return_log (bool, optional):
             Whether to only return the log. Defaults to False.
+        mixed_precision (bool, optional):
+            Whether to run the model in mixed precision, using bfloat16 where it is
+            supported and float16 otherwise. Not supported on MPS devices. Defaults to
+            False.
+        spacy_num_processes (int, optional):
+            The number of processes used to apply spaCy models. Using more than one
+            process is only suitable for spaCy models running on the CPU without a
+            transformer component, and requires the calling script to be guarded by
+            `if __name__ == "__main__"` on platforms which spawn new processes, such
+            as macOS and Windows. Defaults to 1.
+        dataloader_num_workers (int, optional):
+            The number of background workers used to collate the batches when
+            evaluating PyTorch models. If this is positive and the model is evaluated
+            on a GPU then the batches are furthermore pinned to memory, so that
+            host-to-device transfers can overlap with the inference. Defaults to 0,
+            meaning that the batches are collated in the main process.
         architecture_fname (str or None, optional):
             The name of the architecture file, if local models are used. If None, the
             architecture file will be automatically detected as the first Python script
@@ -186,7 +258,7 @@ class EvaluationConfig:
 
     raise_error_on_invalid_model: bool
     cache_dir: str
-    use_auth_token: Union[bool, str]
+    use_auth_token: bool | str
     progress_bar: bool
     save_results: bool
     verbose: bool
@@ -194,8 +266,11 @@ class EvaluationConfig:
     country_code: CountryCode
     prefer_device: Device
     only_return_log: bool = False
-    architecture_fname: Optional[str] = None
-    weight_fname: Optional[str] = None
+    mixed_precision: bool = False
+    spacy_num_processes: int = 1
+    dataloader_num_workers: int = 0
+    architecture_fname: str | None = None
+    weight_fname: str | None = None
     testing: bool = False
 
     @property
@@ -252,14 +327,66 @@ class ModelConfig:
 
     model_id: str
     tokenizer_id: str
-    processor_id: Optional[str]
+    processor_id: str | None
     revision: str
     framework: Framework
-    id2label: Optional[List[str]]
-    label2id: Optional[Dict[str, int]] = None
+    id2label: list[str] | None
+    label2id: dict[str, int] | None = None
 
     @property
-    def num_labels(self) -> Union[int, None]:
+    def num_labels(self) -> int | None:
         if self.id2label is None:
             return None
         return len(self.id2label)
+
+
+@lru_cache(maxsize=None)
+def get_id2label(labels: tuple[LabelConfig, ...]) -> tuple[str, ...]:
+    """Get the mapping from ID to label.
+
+    Args:
+        labels (tuple of LabelConfig objects):
+            The labels of a task.
+
+    Returns:
+        tuple of str:
+            The mapping from ID to label.
+    """
+    return tuple(label.name for label in labels)
+
+
+@lru_cache(maxsize=None)
+def get_label2id(labels: tuple[LabelConfig, ...]) -> Mapping[str, int]:
+    """Get the mapping from label to ID, including all label synonyms.
+
+    As the mapping is shared between all callers, a read-only view of it is returned.
+
+    Args:
+        labels (tuple of LabelConfig objects):
+            The labels of a task.
+
+    Returns:
+        mapping of str to int:
+            The read-only mapping from label to ID.
+    """
+    label_synonyms = get_label_synonyms(labels=labels)
+    all_synonyms = chain.from_iterable(label_synonyms)
+    all_ids = chain.from_iterable(
+        repeat(idx, len(synonyms)) for idx, synonyms in enumerate(label_synonyms)
+    )
+    return MappingProxyType(dict(zip(all_synonyms, all_ids)))
+
+
+@lru_cache(maxsize=None)
+def get_label_synonyms(labels: tuple[LabelConfig, ...]) -> tuple[tuple[str, ...], ...]:
+    """Get the synonyms of all the labels, including the main label.
+
+    Args:
+        labels (tuple of LabelConfig objects):
+            The labels of a task.
+
+    Returns:
+        tuple of tuple of str:
+            The synonyms of each label, with the main label first.
+    """
+    return tuple((label.name, *label.synonyms) for label in labels)
@@ -47,6 +47,22 @@ class Evaluator:
             Defaults to "cuda".
         only_return_log (bool, optional):
             Whether to only return the log of the evaluation. Defaults to False.
+        mixed_precision (bool, optional):
+            Whether to run the model in mixed precision, using bfloat16 where it is
+            supported and float16 otherwise. Not supported on MPS devices. Defaults to
+            False.
+        spacy_num_processes (int, optional):
+            The number of processes used to apply spaCy models. Using more than one
+            process is only suitable for spaCy models running on the CPU without a
+            transformer component, and requires the calling script to be guarded by
+            `if __name__ == "__main__"` on platforms which spawn new processes, such
+            as macOS and Windows. Defaults to 1.
+        dataloader_num_workers (int, optional):
+            The number of background workers used to collate the batches when
+            evaluating PyTorch models. If this is positive and the model is evaluated
+            on a GPU then the batches are furthermore pinned to memory, so that
+            host-to-device transfers can overlap with the inference. Defaults to 0,
+            meaning that the batches are collated in the main process.
         architecture_fname (str or None, optional):
             The name of the architecture file, if local models are used. If None, the
             architecture file will be automatically detected as the first Python script
@@ -78,6 +94,9 @@ class Evaluator:
         country_code: Union[str, CountryCode] = CountryCode.EMPTY,  # type: ignore[attr-defined]
         prefer_device: Device = Device.CUDA,
         only_return_log: bool = False,
+        mixed_precision: bool = False,
+        spacy_num_processes: int = 1,
+        dataloader_num_workers: int = 0,
         architecture_fname: Optional[str] = None,
         weight_fname: Optional[str] = None,
         verbose: bool = False,
@@ -102,6 +121,9 @@ class Evaluator:
             architecture_fname=architecture_fname,
             weight_fname=weight_fname,
             only_return_log=only_return_log,
+            mixed_precision=mixed_precision,
+            spacy_num_processes=spacy_num_processes,
+            dataloader_num_workers=dataloader_num_workers,
         )
 
         # Initialise variable storing model lists, so we only have to fetch it once
@@ -241,11 +263,6 @@ class Evaluator:
         else:
             task_configs = [task_mapping[task] for task in task_name]
 
-        # Set task config architecture field to supertask if it is not already set
-        for task_config in task_configs:
-            if task_config.architectures is None:
-                task_config.architectures = [task_config.supertask]
-
         return task_configs
 
     def _evaluate_single(
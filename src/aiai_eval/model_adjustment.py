@@ -44,7 +44,7 @@ def adjust_model_to_task(
 
     # If the model does not have label conversions, then use the defaults
     if model_config.id2label is None:
-        model_id2label = task_config.id2label
+        model_id2label = list(task_config.id2label)
 
     # If the model *does* have conversions, then ensure that it can deal with all the
     # labels in the default conversions. This ensures that we can smoothly deal with
@@ -83,7 +83,7 @@ def adjust_model_to_task(
                 continue
 
         # Get the synonyms of all the labels, new ones included
-        new_synonyms = list(task_config.label_synonyms)
+        new_synonyms = [list(syns) for syns in task_config.label_synonyms]
         flat_dataset_synonyms = [
             syn for lst in task_config.label_synonyms for syn in lst
         ]
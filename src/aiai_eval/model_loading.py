@@ -152,7 +152,7 @@ def get_model_config(
     elif pytorch_model_exists_locally(model_id=model_id):
         return get_pytorch_model_config_locally(
             model_folder=model_id,
-            dataset_id2label=task_config.id2label,
+            dataset_id2label=list(task_config.id2label),
         )
 
     # If it does not exist on any of the available model sources, raise an error
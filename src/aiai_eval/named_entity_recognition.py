@@ -2,10 +2,13 @@
 
 from copy import deepcopy
 from functools import partial
-from typing import List, Optional, Sequence, Tuple, Union
+from itertools import chain
+from typing import List, Mapping, Optional, Sequence, Tuple, Union
 
 import numpy as np
+import torch
 from datasets.arrow_dataset import Dataset
+from spacy.language import Language
 from spacy.tokens import Token
 from transformers.configuration_utils import PretrainedConfig
 from transformers.data.data_collator import DataCollatorForTokenClassification
@@ -77,6 +80,26 @@ class NamedEntityRecognition(Task):
 
         return aligned_spacy_predictions
 
+    def _get_unused_spacy_components(self, model: Language) -> List[str]:
+        # We only disable the components which are known not to affect the entities.
+        # These are identified by their factory, as the components can be given
+        # custom names. All other components, such as entity rulers and the
+        # token-to-vector layers which the entity recognizer might listen to, are kept
+        unused_factories = [
+            "tagger",
+            "parser",
+            "lemmatizer",
+            "trainable_lemmatizer",
+            "morphologizer",
+            "attribute_ruler",
+            "senter",
+        ]
+        return [
+            name
+            for name in model.pipe_names
+            if model.get_pipe_meta(name).factory in unused_factories
+        ]
+
     def _load_data_collator(
         self, tokenizer_or_processor: PreTrainedTokenizerBase
     ) -> DataCollatorForTokenClassification:
@@ -95,9 +118,15 @@ class NamedEntityRecognition(Task):
         # Extract the labels from the dataset
         labels = prepared_dataset["labels"]
 
-        # Collapse the logits into single predictions for every sample
-        if any(has_floats(pred) for pred in predictions):
-            predictions = np.argmax(predictions, axis=-1)
+        # Collapse the logits into single predictions for every sample. The samples
+        # are either all logits or all tags, so it suffices to check the first one.
+        # The logits can only be collapsed in one go if they have been padded to the
+        # same length
+        if len(predictions) > 0 and has_floats(predictions[0]):
+            if isinstance(predictions, np.ndarray):
+                predictions = np.argmax(predictions, axis=-1)
+            else:
+                predictions = [np.argmax(pred, axis=-1) for pred in predictions]
 
         # Remove ignored index from predictions and labels
         predictions, labels = remove_ignored_index_from_predictions_and_labels(
@@ -120,23 +149,27 @@ class NamedEntityRecognition(Task):
         # Return the predictions and labels, both with and without MISC tags
         return [(predictions, labels), (predictions_no_misc, labels_no_misc)]
 
+    def _collapse_logits(self, logits: torch.Tensor) -> torch.Tensor:
+        return logits.argmax(dim=-1)
+
     def _check_if_model_is_trained_for_task(self, model_predictions: list) -> bool:
 
         sample_preds = model_predictions[0]
-        has_sequence_elements = len(sample_preds[0]) > 0
         elements_are_strings = isinstance(sample_preds[0], str)
-        leaves_are_floats = (
-            not elements_are_strings and sample_preds[0][0].dtype.kind == "f"
+        elements_are_label_ids = (
+            not elements_are_strings
+            and np.ndim(sample_preds) == 1
+            and np.asarray(sample_preds).dtype.kind in "iu"
         )
 
-        return (has_sequence_elements and leaves_are_floats) or elements_are_strings
+        return elements_are_label_ids or elements_are_strings
 
 
 def tokenize_and_align_labels(
     examples: BatchEncoding,
     tokenizer: PreTrainedTokenizerBase,
     model_label2id: Optional[dict],
-    dataset_id2label: list,
+    dataset_id2label: Sequence[str],
     label_column_name: str,
 ) -> BatchEncoding:
     """Tokenize all texts and align the labels with them.
@@ -149,8 +182,8 @@ def tokenize_and_align_labels(
         model_label2id (dict or None):
             A dictionary that converts NER tags to IDs. If None then no label
             conversion has been set up for the model and an error is raised.
-        dataset_id2label (list):
-            A list that maps IDs to NER tags.
+        dataset_id2label (sequence of str):
+            A sequence that maps IDs to NER tags.
         label_column_name (str):
             The name of the label column.
 
@@ -176,11 +209,9 @@ def tokenize_and_align_labels(
         examples["tokens"],
         is_split_into_words=True,
         truncation=True,
-        padding=True,
     )
-    all_labels: List[List[int]] = []
-    for i, ner_tags in enumerate(examples[label_column_name]):
-        labels = [dataset_id2label[ner_tag] for ner_tag in ner_tags]
+    all_word_ids: List[List[Optional[int]]] = list()
+    for i in range(len(examples["tokens"])):
         try:
             word_ids = tokenized_inputs.word_ids(batch_index=i)
 
@@ -249,45 +280,71 @@ def tokenize_and_align_labels(
                     ][0]
                     word_ids.append(word_idx)
 
-        previous_word_idx = None
-        label_ids: List[int] = list()
-        for word_idx in word_ids:
-
-            # Special tokens have a word id that is None. We set the label to -100 so
-            # they are automatically ignored in the loss function
-            if word_idx is None:
-                label_ids.append(-100)
-
-            # We set the label for the first token of each word
-            elif word_idx != previous_word_idx:
-                label = labels[word_idx]
-                try:
-                    label_id = model_label2id[label.upper()]
-                except KeyError:
-                    raise MissingLabel(label=label, label2id=model_label2id)
-                label_ids.append(label_id)
-
-            # For the other tokens in a word, we set the label to -100
-            else:
-                label_ids.append(-100)
+        all_word_ids.append(word_ids)
 
-            previous_word_idx = word_idx
+    # Convert every NER tag in the dataset to the corresponding label ID of the model,
+    # using -1 for tags which the model does not know about
+    tag_to_label_id = np.array(
+        [model_label2id.get(label.upper(), -1) for label in dataset_id2label],
+        dtype=np.int64,
+    )
 
-        all_labels.append(label_ids)
+    # Flatten the word IDs and NER tags of all the examples, so that the labels can
+    # be aligned for the whole batch at once. Special tokens get the word ID -1
+    num_tokens = [len(word_ids) for word_ids in all_word_ids]
+    word_id_array = np.array(
+        [
+            -1 if word_idx is None else word_idx
+            for word_idx in chain.from_iterable(all_word_ids)
+        ],
+        dtype=np.int64,
+    )
+    ner_tags = examples[label_column_name]
+    tag_array = np.fromiter(chain.from_iterable(ner_tags), dtype=np.int64)
+    tag_offsets = np.cumsum([0] + [len(tags) for tags in ner_tags])[:-1]
+    token_offsets = np.cumsum([0] + num_tokens)[:-1]
+
+    # We set the label for the first token of each word. Special tokens and the other
+    # tokens in a word get the label -100, so that they are ignored
+    previous_word_ids = np.roll(word_id_array, 1)
+    previous_word_ids[token_offsets[token_offsets < len(word_id_array)]] = -1
+    is_first_token = (word_id_array >= 0) & (word_id_array != previous_word_ids)
+    example_idxs = np.repeat(np.arange(len(num_tokens)), num_tokens)
+    tag_idxs = tag_offsets[example_idxs] + word_id_array
+    first_token_tags = tag_array[tag_idxs[is_first_token]]
+    label_id_array = np.full(len(word_id_array), -100, dtype=np.int64)
+    label_id_array[is_first_token] = tag_to_label_id[first_token_tags]
+
+    # Raise an error if any of the labels are not known by the model
+    missing_tags = first_token_tags[tag_to_label_id[first_token_tags] == -1]
+    if len(missing_tags) > 0:
+        raise MissingLabel(
+            label=dataset_id2label[missing_tags[0]], label2id=model_label2id
+        )
+
+    # Split the labels back up into the individual examples
+    all_labels = [
+        labels.tolist()
+        for labels in np.split(label_id_array, np.cumsum(num_tokens)[:-1])
+    ]
     tokenized_inputs["labels"] = all_labels
     return tokenized_inputs
 
 
-def get_ent(token: Token, dataset_id2label: list, dataset_label2id: dict) -> str:
+def get_ent(
+    token: Token,
+    dataset_id2label: Sequence[str],
+    dataset_label2id: Mapping[str, int],
+) -> str:
     """Extracts the entity from a SpaCy token.
 
     Args:
         token (spaCy Token):
             The inputted token from spaCy.
-        dataset_id2label (list):
-            A list that maps IDs to NER tags.
-        dataset_label2id (dict):
-            A dictionary that converts NER tags (and their synonyms) to IDs.
+        dataset_id2label (sequence of str):
+            A sequence that maps IDs to NER tags.
+        dataset_label2id (mapping of str to int):
+            A mapping that converts NER tags (and their synonyms) to IDs.
 
     Returns:
         str:
@@ -323,7 +380,8 @@ def remove_ignored_index_from_predictions_and_labels(
 
     Args:
         predictions (list of lists):
-            The predicted labels.
+            The predicted labels, either as label IDs or as NER tags. The predictions
+            might be longer than the labels, if they have been padded.
         labels (list of lists):
             The true labels.
         model_id2label (list of str, or None):
@@ -340,30 +398,40 @@ def remove_ignored_index_from_predictions_and_labels(
     if model_id2label is None:
         return predictions, labels
 
-    # Otherwise, we firstly remove the ignored index from the predictions, using the
-    # labels
-    predictions = [
-        [
-            model_id2label[pred_id]
-            for pred_id, lbl_id in zip(pred, label)
-            if lbl_id != index_to_ignore
-        ]
-        for pred, label in zip(predictions, labels)
-    ]
-
-    # Next, we remove the ignored index from the labels
-    labels = [
-        [model_id2label[lbl_id] for lbl_id in label if lbl_id != index_to_ignore]
-        for label in labels
-    ]
+    # Otherwise, we remove the ignored index from the predictions and labels of each
+    # example, using the labels, and convert the remaining IDs to NER tags. This is
+    # done using array indexing rather than looking up every ID individually
+    id2label_array = np.asarray(model_id2label, dtype=object)
+    predictions_without_ignored: List[List[str]] = list()
+    labels_without_ignored: List[List[str]] = list()
+    for pred, label in zip(predictions, labels):
+        pred_array = np.asarray(pred)
+        label_array = np.asarray(label, dtype=np.int64)
+
+        # The predictions might have been padded, so we only use the predictions
+        # which have a corresponding label
+        num_preds = min(len(pred_array), len(label_array))
+        pred_mask = label_array[:num_preds] != index_to_ignore
+        pred_array = pred_array[:num_preds][pred_mask]
+
+        # Convert the predicted label IDs to NER tags. Predictions which already are
+        # NER tags are kept as they are
+        if pred_array.dtype.kind in "iu":
+            pred_tags = id2label_array[pred_array].tolist()
+        else:
+            pred_tags = [str(tag) for tag in pred_array]
+        predictions_without_ignored.append(pred_tags)
+
+        label_tags = id2label_array[label_array[label_array != index_to_ignore]]
+        labels_without_ignored.append(label_tags.tolist())
 
     # Finally, we return the predictions and labels
-    return predictions, labels
+    return predictions_without_ignored, labels_without_ignored
 
 
 def replace_unknown_tags_with_misc_tags(
     list_of_tag_lists: List[List[str]],
-    dataset_id2label: List[str],
+    dataset_id2label: Sequence[str],
 ) -> List[List[str]]:
     """Replaces unknown tags with MISC tags.
 
@@ -375,7 +443,7 @@ def replace_unknown_tags_with_misc_tags(
     Args:
         list_of_tag_lists (list of list of str):
             A list of lists containing NER tags.
-        dataset_id2label (list of str):
+        dataset_id2label (sequence of str):
             The mapping from label IDs to labels.
 
     Returns:
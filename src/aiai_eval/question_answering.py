@@ -68,6 +68,18 @@ class QuestionAnswering(Task):
         # Package the predictions and labels into the standard format and return them
         return [(predictions, labels)]
 
+    def _get_feature_indices(
+        self, dataset: Dataset, prepared_dataset: Dataset
+    ) -> List[List[int]]:
+
+        # Long contexts are split into several features during preprocessing, so we
+        # use the example IDs to find the features belonging to each example
+        id_to_index = {example_id: idx for idx, example_id in enumerate(dataset["id"])}
+        feature_indices: List[List[int]] = [list() for _ in range(len(dataset))]
+        for feature_idx, example_id in enumerate(prepared_dataset["id"]):
+            feature_indices[id_to_index[example_id]].append(feature_idx)
+        return feature_indices
+
     def _check_if_model_is_trained_for_task(self, model_predictions: list) -> bool:
         sample_preds = model_predictions[0]
         elements_are_pairs = len(sample_preds[0]) == 2
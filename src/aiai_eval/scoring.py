@@ -2,7 +2,7 @@
 
 import logging
 import warnings
-from typing import Dict, List, Sequence, Tuple, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
@@ -17,6 +17,7 @@ def log_scores(
     scores: Sequence[Dict[str, float]],
     model_id: str,
     only_return_log: bool = False,
+    aggregated_scores: Optional[Dict[str, float]] = None,
 ) -> Union[dict, str]:
     """Log the scores.
 
@@ -31,6 +32,11 @@ def log_scores(
             The full Hugging Face Hub path to the pretrained transformer model.
         only_return_log (bool, optional):
             If only the logging string should be returned. Defaults to False.
+        aggregated_scores (dict or None, optional):
+            Scores which have been measured once across all the iterations, with the
+            names of the metrics as keys. These are logged without a standard error.
+            If None then all the scores are aggregated from `scores`. Defaults to
+            None.
 
     Returns:
         dict or str:
@@ -48,16 +54,28 @@ def log_scores(
 
     # Logging of the aggregated scores
     for metric_cfg in metric_configs:
-        test_score, test_se = aggregate_scores(scores=scores, metric_config=metric_cfg)
-        test_score_str = metric_cfg.postprocessing_fn(test_score)
-        test_se_str = metric_cfg.postprocessing_fn(test_se)
 
-        msg = f"{metric_cfg.pretty_name}:\n↳  {test_score_str} ± {test_se_str}"
+        # Scores which have only been measured once do not have a standard error
+        test_se: Optional[float] = None
+        if aggregated_scores is not None and metric_cfg.name in aggregated_scores:
+            test_score = aggregated_scores[metric_cfg.name]
+            test_score_str = metric_cfg.postprocessing_fn(test_score)
+            msg = f"{metric_cfg.pretty_name}:\n↳  {test_score_str}"
+
+        else:
+            test_score, test_se = aggregate_scores(
+                scores=scores, metric_config=metric_cfg
+            )
+            test_score_str = metric_cfg.postprocessing_fn(test_score)
+            test_se_str = metric_cfg.postprocessing_fn(test_se)
+            msg = f"{metric_cfg.pretty_name}:\n↳  {test_score_str} ± {test_se_str}"
+
         logging_strings.append(msg)
 
         # Store the aggregated test scores
         total_dict[metric_cfg.name] = test_score
-        total_dict[f"{metric_cfg.name}_se"] = test_se
+        if test_se is not None:
+            total_dict[f"{metric_cfg.name}_se"] = test_se
 
         # Log the scores
         logger.info(msg)
@@ -3,6 +3,7 @@
 from typing import List, Optional, Sequence, Tuple, Union
 
 import numpy as np
+import torch
 from datasets.arrow_dataset import Dataset
 from transformers.configuration_utils import PretrainedConfig
 from transformers.data.data_collator import DataCollatorWithPadding
@@ -16,7 +17,6 @@ from .exceptions import (
     WrongFeatureColumnName,
 )
 from .task import Task
-from .utils import has_floats
 
 
 class SequenceClassification(Task):
@@ -56,27 +56,33 @@ class SequenceClassification(Task):
         dataset: Dataset,
         prepared_dataset: Dataset,
         **kwargs,
-    ) -> List[Tuple[list, list]]:
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
 
         # Collapse the logits into single predictions for every sample
-        if has_floats(predictions):
-            predictions = np.argmax(predictions, axis=-1)
+        prediction_array = np.asarray(predictions)
+        if prediction_array.dtype.kind == "f":
+            prediction_array = np.argmax(prediction_array, axis=-1)
 
-        # Extract labels from dataset
-        labels = prepared_dataset["labels"]
+        # Extract labels from dataset, directly as a NumPy array
+        labels = prepared_dataset.with_format("numpy")["labels"]
 
         # Return the predictions and labels
-        return [(list(predictions), list(labels))]
+        return [(prediction_array, labels)]
 
     def _load_data_collator(
         self, tokenizer_or_processor: PreTrainedTokenizerBase
     ) -> DataCollatorWithPadding:
-        return DataCollatorWithPadding(tokenizer_or_processor, padding="longest")
+        return DataCollatorWithPadding(
+            tokenizer_or_processor, padding="longest", pad_to_multiple_of=8
+        )
+
+    def _collapse_logits(self, logits: torch.Tensor) -> torch.Tensor:
+        return logits.argmax(dim=-1)
 
     def _check_if_model_is_trained_for_task(self, model_predictions: list) -> bool:
-        sample_preds = model_predictions[0]
-        elements_are_floats = sample_preds[0].dtype.kind == "f"
-        return elements_are_floats
+        sample_preds = np.asarray(model_predictions[0])
+        is_label_id = sample_preds.ndim == 0 and sample_preds.dtype.kind in "iu"
+        return is_label_id
 
     def _spacy_preprocess_fn(self, examples: dict) -> dict:
         raise FrameworkCannotHandleTask(
@@ -92,7 +98,7 @@ class SequenceClassification(Task):
 def tokenize_and_numericalize(
     examples: BatchEncoding,
     tokenizer: PreTrainedTokenizerBase,
-    feature_column_names: List[str],
+    feature_column_names: Sequence[str],
     label_column_name: str,
     model_label2id: Optional[dict],
 ) -> BatchEncoding:
@@ -103,7 +109,7 @@ def tokenize_and_numericalize(
             The examples to tokenize.
         tokenizer (PreTrainedTokenizerBase):
             The tokenizer to use.
-        feature_column_names (list of str):
+        feature_column_names (sequence of str):
             The names of the columns containing the features.
         label_column_name (str):
             The name of the column containing the labels.
@@ -134,26 +140,33 @@ def tokenize_and_numericalize(
         examples = tokenizer(
             *[examples[feat_col] for feat_col in feature_column_names],
             truncation=True,
-            padding=True,
         )
         examples["labels"] = labels
 
     except KeyError:
         raise WrongFeatureColumnName(feature_column_names)
 
-    # Attempt to numericalize the labels
-    try:
-        examples["labels"] = [model_label2id[lbl.upper()] for lbl in examples["labels"]]
-
-    # The numericalization fails if the label is not in the model's label2id mapping,
-    # in which case we raise a MissingLabel exception
-    except KeyError:
-        missing_label = [
-            lbl.upper()
-            for lbl in examples["labels"]
-            if lbl.upper() not in model_label2id
-        ][0]
-        raise MissingLabel(label=missing_label, label2id=model_label2id)
+    # Numericalize the labels by only looking up the distinct labels in the model's
+    # label2id mapping, and then gathering the label IDs for all the examples at once
+    unique_labels, first_idxs, inverse = np.unique(
+        np.asarray(examples["labels"], dtype=object),
+        return_index=True,
+        return_inverse=True,
+    )
+
+    # The numericalization fails if a label is not in the model's label2id mapping, in
+    # which case we raise a MissingLabel exception for the first such label in the
+    # examples
+    for lbl in unique_labels[np.argsort(first_idxs)]:
+        if lbl.upper() not in model_label2id:
+            raise MissingLabel(label=lbl.upper(), label2id=model_label2id)
+
+    label_ids = np.fromiter(
+        (model_label2id[lbl.upper()] for lbl in unique_labels),
+        dtype=np.int64,
+        count=len(unique_labels),
+    )
+    examples["labels"] = label_ids[inverse].tolist()
 
     # Return the examples, now with numerical labels
     return examples
@@ -1,17 +1,22 @@
 """Abstract Task class."""
 
+import inspect
 import logging
-import random
+import sys
 import warnings
 from abc import ABC, abstractmethod
-from functools import partial
+from functools import lru_cache, partial
 from typing import Dict, List, Optional, Sequence, Tuple, Union
 
+import datasets
 import evaluate as evaluate_hf
 import numpy as np
+import pyarrow.compute as pc
 import torch
 import torch.nn as nn
+import transformers
 from datasets.arrow_dataset import Dataset
+from datasets.fingerprint import Hasher
 from datasets.load import load_dataset
 from spacy.language import Language
 from torch.utils.data import DataLoader
@@ -42,6 +47,14 @@ from .utils import clear_memory, enforce_reproducibility
 logger = logging.getLogger(__name__)
 
 
+# The names of the features used as model inputs, for each input modality. Whisper
+# takes "input_features", while Wav2Vec2 takes "input_values"
+MODEL_INPUT_NAMES: Dict[Modality, List[str]] = {
+    Modality.TEXT: ["input_ids", "attention_mask", "token_type_ids"],
+    Modality.AUDIO: ["input_features", "input_values"],
+}
+
+
 class Task(ABC):
     """Abstract evaluation task class.
 
@@ -62,9 +75,10 @@ class Task(ABC):
         self.task_config = task_config
         self.evaluation_config = evaluation_config
 
-        # Load the metric functions from the `datasets` library
+        # Load the metric functions from the `evaluate` library. These are shared
+        # between all tasks using the same metric
         self._metrics = {
-            metric_cfg.name: evaluate_hf.load(metric_cfg.huggingface_id)
+            metric_cfg.name: load_metric(huggingface_id=metric_cfg.huggingface_id)
             for metric_cfg in task_config.metrics
         }
 
@@ -118,12 +132,26 @@ class Task(ABC):
         # Load the dataset
         dataset = self._load_data()
 
-        # Remove empty examples from the datasets
-        for feat_column in self.task_config.feature_column_names:
-            try:
-                dataset = dataset.filter(lambda record: len(record[feat_column]) > 0)
-            except KeyError:
-                raise WrongFeatureColumnName(feat_column)
+        # Check that the feature columns are present in the dataset
+        feature_column_names = list(self.task_config.feature_column_names)
+        missing_columns = [
+            feat_column
+            for feat_column in feature_column_names
+            if feat_column not in dataset.column_names
+        ]
+        if missing_columns:
+            raise WrongFeatureColumnName(missing_columns)
+
+        # Remove empty examples from the dataset, in a single batched pass over the
+        # feature columns
+        dataset = dataset.filter(
+            lambda *feat_columns: [
+                all(len(feature) > 0 for feature in features)
+                for features in zip(*feat_columns)
+            ],
+            input_columns=feature_column_names,
+            batched=True,
+        )
 
         # Set variable with number of iterations
         num_iter = 10 if not self.evaluation_config.testing else 2
@@ -135,29 +163,36 @@ class Task(ABC):
 
         # Log the number of parameters in the model
         if model_config.framework == Framework.PYTORCH:
-            num_params = sum(p.numel() for p in model.parameters() if p.requires_grad)
+            if isinstance(model, PreTrainedModel):
+                num_params = model.num_parameters(only_trainable=True)
+            else:
+                num_params = sum(
+                    p.numel() for p in model.parameters() if p.requires_grad
+                )
             logger.info(f"Number of model parameters: {num_params:,}")
 
         # If we are testing then truncate the test set
         if self.evaluation_config.testing:
             dataset = dataset.select(range(4))
 
-        # Get bootstrapped datasets
-        bootstrapped_datasets = [
-            Dataset.from_dict(dataset[rng.integers(0, len(dataset), len(dataset))])
-            for _ in range(num_iter)
+        # Get the indices of the bootstrapped datasets
+        bootstrap_indices = [
+            rng.integers(0, len(dataset), len(dataset)) for _ in range(num_iter)
         ]
 
-        # Preprocess the bootstrapped datasets
-        prepared_datasets = [
-            self._preprocess_data(
-                bootstrapped_dataset,
-                framework=model_config.framework,
-                model_config=model_config,
-                tokenizer=tokenizer,
-            )
-            for bootstrapped_dataset in bootstrapped_datasets
-        ]
+        # Preprocess the dataset once, and bootstrap the preprocessed dataset using the
+        # preprocessed examples associated with each example in the dataset. This
+        # ensures that every example is only preprocessed once, rather than `num_iter`
+        # times
+        prepared_dataset = self._preprocess_data(
+            dataset,
+            framework=model_config.framework,
+            model_config=model_config,
+            tokenizer=tokenizer,
+        )
+        feature_indices = self._get_feature_indices(
+            dataset=dataset, prepared_dataset=prepared_dataset
+        )
 
         # Set up progress bar
         if self.evaluation_config.progress_bar:
@@ -165,33 +200,76 @@ class Task(ABC):
         else:
             itr = range(num_iter)
 
+        # Start carbon emissions tracking. We track the emissions of all the
+        # iterations at once, as starting and stopping the tracker has an overhead
+        if self.evaluation_config.track_carbon_emissions:
+            self.carbon_tracker.start()
+
         scores = list()
-        for idx in itr:
-            while True:
-                test_itr_scores_or_err = self._evaluate_single_iteration(
-                    idx=idx,
-                    model=model,
-                    model_config=model_config,
-                    tokenizer=tokenizer,
-                    processor=processor,
-                    framework=model_config.framework,
-                    dataset=bootstrapped_datasets[idx],
-                    prepared_dataset=prepared_datasets[idx],
+        num_prepared_examples = 0
+        try:
+            for idx in itr:
+
+                # Get the bootstrapped datasets for this iteration. These are views of
+                # the datasets, sharing the same underlying Arrow tables, and are built
+                # lazily so that only a single iteration's index mappings are kept in
+                # memory
+                indices = bootstrap_indices[idx]
+                bootstrapped_dataset = dataset.select(indices)
+                bootstrapped_prepared_dataset = prepared_dataset.select(
+                    [
+                        feature_idx
+                        for example_idx in indices
+                        for feature_idx in feature_indices[example_idx]
+                    ]
                 )
+                num_prepared_examples += len(bootstrapped_prepared_dataset)
+
+                while True:
+                    test_itr_scores_or_err = self._evaluate_single_iteration(
+                        idx=idx,
+                        model=model,
+                        model_config=model_config,
+                        tokenizer=tokenizer,
+                        processor=processor,
+                        framework=model_config.framework,
+                        dataset=bootstrapped_dataset,
+                        prepared_dataset=bootstrapped_prepared_dataset,
+                    )
 
-                # If the iteration was successful then break the while-loop
-                if isinstance(test_itr_scores_or_err, dict):
-                    break
+                    # If the iteration was successful then break the while-loop
+                    if isinstance(test_itr_scores_or_err, dict):
+                        break
 
-                # Otherwise we encountered an error
-                else:
-                    raise InvalidEvaluation(
-                        f"An unknown error occurred during the evaluation of the {idx} "
-                        "iteration. The error message returned was: "
-                        f"{str(test_itr_scores_or_err)}"
-                    )
+                    # Otherwise we encountered an error
+                    else:
+                        raise InvalidEvaluation(
+                            "An unknown error occurred during the evaluation of the "
+                            f"{idx} iteration. The error message returned was: "
+                            f"{str(test_itr_scores_or_err)}"
+                        )
+
+                scores.append(test_itr_scores_or_err)
 
-            scores.append(test_itr_scores_or_err)
+                # Free the bootstrapped datasets before the next iteration
+                del bootstrapped_dataset, bootstrapped_prepared_dataset
+
+        # Stop carbon emissions tracking, also if the evaluation failed
+        finally:
+            if self.evaluation_config.track_carbon_emissions:
+                self.carbon_tracker.stop()
+
+        # Store the emission metrics, normalised by the total number of examples
+        # evaluated across all the iterations. These are measured once for all the
+        # iterations, so they are reported without a standard error
+        aggregated_scores: Optional[Dict[str, float]] = None
+        if self.evaluation_config.track_carbon_emissions:
+            emissions_data = self.carbon_tracker.final_emissions_data
+            factor = 1_000_000 / num_prepared_examples
+            aggregated_scores = dict(
+                carbon_emissions=factor * emissions_data.emissions,
+                energy_consumed=factor * emissions_data.energy_consumed,
+            )
 
         # If track_carbon_emissions is true append metrics, to correctly log emissions
         # data. We avoid mutating, so any downstream evaluations will not try to use
@@ -208,6 +286,7 @@ class Task(ABC):
             scores=scores,
             model_id=model_config.model_id,
             only_return_log=self.evaluation_config.only_return_log,
+            aggregated_scores=aggregated_scores,
         )
         return all_scores
 
@@ -252,13 +331,6 @@ class Task(ABC):
                 If the MPS device is used, but the CPU fallback is not enabled.
         """
         try:
-            # Set random seeds to enforce reproducibility of the randomly
-            # initialised weights
-            random.seed(703 + idx)
-            np.random.seed(703 + idx)
-            torch.manual_seed(703 + idx)
-            torch.cuda.manual_seed_all(703 + idx)
-
             # Define batch size, which depends on whether we are testing or not
             batch_size = (
                 2
@@ -268,10 +340,6 @@ class Task(ABC):
                 else 32
             )
 
-            # Start carbon emissions tracking
-            if self.evaluation_config.track_carbon_emissions:
-                self.carbon_tracker.start()
-
             # Get model predictions
             model_predictions = self._get_model_predictions(
                 model=model,
@@ -324,14 +392,6 @@ class Task(ABC):
                 predictions_and_labels=prepared_predictions_and_labels,
             )
 
-            # Stop carbon emissions tracking and store emission metrics
-            if self.evaluation_config.track_carbon_emissions:
-                self.carbon_tracker.stop()
-                emissions_data = self.carbon_tracker.final_emissions_data
-                factor = 1_000_000 / len(prepared_dataset)
-                scores["carbon_emissions"] = factor * emissions_data.emissions
-                scores["energy_consumed"] = factor * emissions_data.energy_consumed
-
             return scores
 
         except (RuntimeError, ValueError, IndexError) as e:
@@ -393,6 +453,62 @@ class Task(ABC):
         # Return the results
         return results
 
+    def _get_feature_indices(
+        self, dataset: Dataset, prepared_dataset: Dataset
+    ) -> List[List[int]]:
+        """Get the indices of the preprocessed examples belonging to each example.
+
+        By default every example is preprocessed into exactly one preprocessed
+        example. Tasks which split examples into several preprocessed examples should
+        override this method.
+
+        Args:
+            dataset (Dataset):
+                The raw dataset.
+            prepared_dataset (Dataset):
+                The preprocessed dataset.
+
+        Returns:
+            list of list of int:
+                The indices in `prepared_dataset` for every example in `dataset`.
+        """
+        return [[idx] for idx in range(len(dataset))]
+
+    def _get_unused_spacy_components(self, model: Language) -> List[str]:
+        """Get the components of a spaCy pipeline which the task does not use.
+
+        These components are disabled when the spaCy model is applied. By default
+        all the components are used. Tasks which only rely on some of the components
+        should override this method.
+
+        Args:
+            model (spaCy Language):
+                The spaCy model.
+
+        Returns:
+            list of str:
+                The names of the unused components.
+        """
+        return list()
+
+    def _collapse_logits(self, logits: torch.Tensor) -> torch.Tensor:
+        """Collapse a batch of logits into the predictions used downstream.
+
+        This is applied on the device, before the predictions are moved to the CPU.
+        By default the logits are kept as they are. Tasks which only need the
+        predicted labels should override this method, to reduce the amount of data
+        that is moved off the device.
+
+        Args:
+            logits (torch.Tensor):
+                The logits output by the model for a batch.
+
+        Returns:
+            torch.Tensor:
+                The collapsed predictions.
+        """
+        return logits
+
     def _load_data(self) -> Dataset:
         """Load the dataset.
 
@@ -425,28 +541,21 @@ class Task(ABC):
             dict:
                 The prepared batch.
         """
-        # Move the tensors to the correct device
-        batch = {
-            key: value.to(self.evaluation_config.device) for key, value in batch.items()
-        }
-
         # Create a view of the batch with only desired features
-        if input_modality == Modality.TEXT:
-            accepted_transformer_features = [
-                "input_ids",
-                "attention_mask",
-                "token_type_ids",
-            ]
-        # Whisper takes "input_features", while Wav2Vec2 takes "input_values"
-        elif input_modality == Modality.AUDIO:
-            accepted_transformer_features = ["input_features", "input_values"]
-
+        accepted_transformer_features = MODEL_INPUT_NAMES[input_modality]
         batch = {
             key: value
             for key, value in batch.items()
             if key in accepted_transformer_features
         }
 
+        # Move the tensors to the correct device. The copies are non-blocking, which
+        # only has an effect if the tensors are in pinned memory
+        device = self.evaluation_config.device
+        batch = {
+            key: value.to(device, non_blocking=True) for key, value in batch.items()
+        }
+
         # Return the prepared batch
         return batch
 
@@ -458,7 +567,7 @@ class Task(ABC):
         prepared_dataset: Dataset,
         batch_size: int,
         framework: Framework,
-    ) -> list:
+    ) -> Union[list, np.ndarray]:
         """Get the predictions of the model.
 
         Args:
@@ -474,8 +583,9 @@ class Task(ABC):
                 The framework.
 
         Returns:
-            list:
-                The model predictions.
+            list or NumPy array:
+                The model predictions, with one entry per sample. For PyTorch models
+                this is a single array if all the batches have the same shape.
 
         Raises:
             InvalidFramework:
@@ -500,11 +610,26 @@ class Task(ABC):
                     tokenizer_or_processor=tokenizer
                 )
 
+            # Remove the columns which are not used as model inputs, so that they are
+            # not collated in every batch
+            input_names = MODEL_INPUT_NAMES[self.task_config.modality]
+            prepared_dataset = prepared_dataset.remove_columns(
+                [col for col in prepared_dataset.column_names if col not in input_names]
+            )
+
+            # Sort the tokenized examples by length, so that the examples in every
+            # batch have roughly the same length. We restore the original order of
+            # the predictions afterwards
+            prepared_dataset, order = self._sort_by_length(
+                prepared_dataset=prepared_dataset
+            )
+
             dataloader = DataLoader(
                 prepared_dataset,
                 batch_size=batch_size,
                 shuffle=False,
                 collate_fn=data_collator,
+                **self._get_dataloader_kwargs(),
             )
 
             # Create progress bar
@@ -513,6 +638,9 @@ class Task(ABC):
             else:
                 itr = dataloader
 
+            # Set up automatic mixed precision, which is a no-op if it is disabled
+            autocast = self._get_autocast()
+
             all_predictions = list()
             for batch in itr:
 
@@ -526,7 +654,7 @@ class Task(ABC):
                 if isinstance(model, PreTrainedModel):
 
                     # Get the model predictions
-                    with torch.no_grad():
+                    with torch.inference_mode(), autocast():
                         with warnings.catch_warnings():
                             warnings.filterwarnings(
                                 action="ignore", category=UserWarning
@@ -579,7 +707,7 @@ class Task(ABC):
                 # If we are dealing with a PyTorch model, then we will only use the
                 # input_ids
                 elif isinstance(model, nn.Module):
-                    with torch.no_grad():
+                    with torch.inference_mode(), autocast():
                         with warnings.catch_warnings():
                             warnings.filterwarnings(
                                 action="ignore", category=UserWarning
@@ -591,13 +719,23 @@ class Task(ABC):
                     model_type = str(type(model))
                     raise UnsupportedModelType(model_type=model_type)
 
-                # Move the predictions back to the CPU and convert it to a NumPy array
-                model_predictions = model_predictions.cpu().numpy()
-
-                # Collect predictions
-                all_predictions.extend(model_predictions)
-
-            return all_predictions
+                # Collapse the logits while they are still on the device, and cast
+                # any remaining logits back to float32 in case they were computed in
+                # mixed precision, as NumPy does not support bfloat16
+                if model_predictions.is_floating_point():
+                    model_predictions = self._collapse_logits(logits=model_predictions)
+                if model_predictions.is_floating_point():
+                    model_predictions = model_predictions.float()
+
+                # Collect the predictions, keeping them on the device so that we do
+                # not have to synchronise with the device after every batch
+                all_predictions.append(model_predictions.detach())
+
+            # Move the predictions back to the CPU, in the original order of the
+            # examples
+            return self._gather_predictions(
+                all_predictions=all_predictions, order=order
+            )
 
         elif framework == Framework.SPACY:
 
@@ -611,8 +749,14 @@ class Task(ABC):
             else:
                 itr = prepared_dataset[self.task_config.feature_column_names[0]]
 
-            # Apply the model to the dataset
-            processed = model.pipe(itr, batch_size=batch_size)
+            # Apply the model to the dataset, parsing the documents in several
+            # processes if this has been enabled
+            processed = model.pipe(
+                itr,
+                batch_size=batch_size,
+                n_process=self.evaluation_config.spacy_num_processes,
+                disable=self._get_unused_spacy_components(model=model),
+            )
 
             # Extract the predictions using a task-specific function
             predictions = map(
@@ -625,6 +769,114 @@ class Task(ABC):
         else:
             raise InvalidFramework(framework=framework)
 
+    def _get_dataloader_kwargs(self) -> dict:
+        """Get the extra keyword arguments for the PyTorch dataloader.
+
+        If any dataloader workers have been requested then we collate the batches in
+        that many background workers, and when evaluating on a GPU we furthermore pin
+        their memory, so that host-to-device transfers can overlap with the
+        inference. The dataloader is recreated in every bootstrap iteration, so the
+        workers are not persisted between them. No workers are used when testing.
+
+        Returns:
+            dict:
+                The keyword arguments.
+        """
+        num_workers = self.evaluation_config.dataloader_num_workers
+        if num_workers <= 0 or self.evaluation_config.testing:
+            return dict()
+        return dict(
+            num_workers=num_workers,
+            pin_memory=self.evaluation_config.device == "cuda",
+        )
+
+    def _get_autocast(self) -> partial:
+        """Get the autocasting context manager used during inference.
+
+        We use bfloat16 where it is supported, as it has the same range as float32,
+        and disable autocasting on MPS, as it is not supported there.
+
+        Returns:
+            partial:
+                A function returning the autocasting context manager, which is
+                disabled if mixed precision is not enabled.
+        """
+        device = self.evaluation_config.device
+        if self.evaluation_config.mixed_precision and device != "mps":
+            if device == "cpu" or torch.cuda.is_bf16_supported():
+                amp_dtype = torch.bfloat16
+            else:
+                amp_dtype = torch.float16
+            return partial(torch.autocast, device_type=device, dtype=amp_dtype)
+        else:
+            return partial(torch.autocast, device_type="cpu", enabled=False)
+
+    def _sort_by_length(
+        self, prepared_dataset: Dataset
+    ) -> Tuple[Dataset, Optional[np.ndarray]]:
+        """Sort a prepared dataset by the length of its tokenized examples.
+
+        This ensures that the examples in every batch have roughly the same length,
+        so that we avoid computing predictions on padding tokens.
+
+        Args:
+            prepared_dataset (Dataset):
+                The prepared dataset.
+
+        Returns:
+            pair of Dataset and NumPy array or None:
+                The sorted dataset and the indices of its examples in the original
+                dataset. The dataset is returned unchanged together with None if it
+                does not contain any token IDs.
+        """
+        if "input_ids" not in prepared_dataset.column_names:
+            return prepared_dataset, None
+        input_ids = prepared_dataset.with_format("arrow")["input_ids"]
+        lengths = pc.list_value_length(input_ids).to_numpy()
+        order = np.argsort(lengths, kind="stable")
+        return prepared_dataset.select(order), order
+
+    def _gather_predictions(
+        self, all_predictions: List[torch.Tensor], order: Optional[np.ndarray]
+    ) -> Union[list, np.ndarray]:
+        """Gather the batched predictions on the CPU, in the original order.
+
+        Args:
+            all_predictions (list of torch.Tensor):
+                The predictions for every batch, which might still be on the device.
+            order (NumPy array or None):
+                The indices in the original dataset of the predicted examples, or None
+                if the examples were not reordered.
+
+        Returns:
+            list or NumPy array:
+                The predictions, with one entry per sample. This is a single array if
+                all the batches have the same shape.
+        """
+        # If all the batches have the same shape, apart from the batch dimension,
+        # then we concatenate them and move them back to the CPU in one go. Otherwise
+        # the batches have been padded to different lengths, so we move them back to
+        # the CPU separately and collect the individual samples
+        predictions: Union[list, np.ndarray]
+        if len({tuple(preds.shape[1:]) for preds in all_predictions}) == 1:
+            predictions = torch.cat(all_predictions, dim=0).cpu().numpy()
+        else:
+            predictions = [
+                sample_preds
+                for preds in all_predictions
+                for sample_preds in preds.cpu().numpy()
+            ]
+
+        # Restore the original order of the examples, if they were reordered
+        if order is not None:
+            inverse_order = np.argsort(order)
+            if isinstance(predictions, np.ndarray):
+                predictions = predictions[inverse_order]
+            else:
+                predictions = [predictions[idx] for idx in inverse_order]
+
+        return predictions
+
     def _preprocess_data(
         self, dataset: Dataset, framework: Framework, **kwargs
     ) -> Dataset:
@@ -658,10 +910,21 @@ class Task(ABC):
                     model_config=kwargs["model_config"],
                     task_config=self.task_config,
                 )
+
+                # We set the fingerprint of the preprocessed dataset explicitly, as
+                # the preprocessing function cannot be hashed deterministically. This
+                # allows the cached preprocessed dataset to be reused across
+                # evaluations of models sharing the same tokenizer
+                fingerprint = self._get_preprocessing_fingerprint(
+                    dataset=dataset,
+                    tokenizer=kwargs["tokenizer"],
+                    model_config=kwargs["model_config"],
+                )
                 preprocessed = dataset.map(
                     preprocess_fn,
                     batched=True,
                     remove_columns=dataset.column_names,
+                    new_fingerprint=fingerprint,
                 )
                 return preprocessed
 
@@ -674,6 +937,83 @@ class Task(ABC):
         except ValueError:
             raise PreprocessingFailed()
 
+    def _get_preprocessing_fingerprint(
+        self,
+        dataset: Dataset,
+        tokenizer: Optional[PreTrainedTokenizerBase],
+        model_config: ModelConfig,
+    ) -> str:
+        """Get the fingerprint of a dataset preprocessed with the PyTorch framework.
+
+        Args:
+            dataset (Dataset):
+                The dataset to be preprocessed.
+            tokenizer (Hugging Face tokenizer or None):
+                The tokenizer used in the preprocessing, or None if the model does not
+                require a tokenizer.
+            model_config (ModelConfig):
+                The model configuration.
+
+        Returns:
+            str:
+                The fingerprint of the preprocessed dataset.
+        """
+        # Extract the state of the tokenizer, which affects the preprocessing. The
+        # vocabulary is included so that changes to local tokenizers are detected,
+        # and the settings which change how texts are split into tokens are included
+        # since they are not part of the vocabulary
+        if tokenizer is not None:
+            tokenizer_state = [
+                type(tokenizer).__name__,
+                tokenizer.name_or_path,
+                tokenizer.model_max_length,
+                tokenizer.padding_side,
+                tokenizer.truncation_side,
+                getattr(tokenizer, "do_lower_case", None),
+                getattr(tokenizer, "add_prefix_space", None),
+                sorted(tokenizer.get_vocab().items()),
+            ]
+        else:
+            tokenizer_state = list()
+
+        # Extract the label state of the task, which the labels are aligned and
+        # converted with
+        task_state = [
+            self.task_config.name,
+            self.task_config.id2label,
+            self.task_config.label_synonyms,
+            self.task_config.label_column_name,
+            self.task_config.feature_column_names,
+        ]
+
+        # Extract the label mapping of the model, which the labels are converted with
+        if model_config.label2id is not None:
+            model_label2id = sorted(model_config.label2id.items())
+        else:
+            model_label2id = list()
+
+        # Extract the source code of the module defining the task. The preprocessing
+        # functions are hashed by their qualified names only, so we hash the source
+        # code to ensure that changes to the preprocessing invalidate the cache
+        task_source = inspect.getsource(sys.modules[type(self).__module__])
+
+        # The library versions are included as well, since the preprocessing depends
+        # on the behaviour of the tokenizers and the dataset operations
+        library_versions = [transformers.__version__, datasets.__version__]
+
+        return Hasher.hash(
+            [
+                dataset._fingerprint,
+                task_source,
+                task_state,
+                library_versions,
+                model_config.tokenizer_id,
+                model_config.revision,
+                tokenizer_state,
+                model_label2id,
+            ]
+        )
+
     def __call__(self, *args, **kwargs):
         return self.evaluate(*args, **kwargs)
 
@@ -793,3 +1133,20 @@ class Task(ABC):
                 Whether the model is trained for the task.
         """
         pass
+
+
+@lru_cache(maxsize=None)
+def load_metric(huggingface_id: str) -> evaluate_hf.EvaluationModule:
+    """Load a metric from the `evaluate` library.
+
+    The metrics are cached, so that every metric is only loaded once.
+
+    Args:
+        huggingface_id (str):
+            The Hugging Face ID of the metric.
+
+    Returns:
+        EvaluationModule:
+            The metric.
+    """
+    return evaluate_hf.load(huggingface_id)
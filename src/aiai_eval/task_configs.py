@@ -31,22 +31,22 @@ SENT = TaskConfig(
     huggingface_subset=None,
     supertask="sequence-classification",
     modality=Modality("text"),
-    metrics=[MCC, MACRO_F1],
-    labels=[
+    metrics=(MCC, MACRO_F1),
+    labels=(
         LabelConfig(
             name="NEGATIVE",
-            synonyms=["NEG", "NEGATIV", "LABEL_0"],
+            synonyms=("NEG", "NEGATIV", "LABEL_0"),
         ),
         LabelConfig(
             name="NEUTRAL",
-            synonyms=["NEU", "LABEL_1"],
+            synonyms=("NEU", "LABEL_1"),
         ),
         LabelConfig(
             name="POSITIVE",
-            synonyms=["POS", "POSITIV", "LABEL_2"],
+            synonyms=("POS", "POSITIV", "LABEL_2"),
         ),
-    ],
-    feature_column_names=["text"],
+    ),
+    feature_column_names=("text",),
     label_column_name="label",
     test_name="test",
 )
@@ -58,23 +58,23 @@ NER = TaskConfig(
     huggingface_subset=None,
     supertask="token-classification",
     modality=Modality("text"),
-    metrics=[SEQEVAL_MICRO_F1, SEQEVAL_MICRO_F1_NO_MISC],
-    labels=[
+    metrics=(SEQEVAL_MICRO_F1, SEQEVAL_MICRO_F1_NO_MISC),
+    labels=(
         LabelConfig(
             name="O",
-            synonyms=[],
+            synonyms=(),
         ),
         LabelConfig(
             name="B-PER",
-            synonyms=["B-PERSON"],
+            synonyms=("B-PERSON",),
         ),
         LabelConfig(
             name="I-PER",
-            synonyms=["I-PERSON"],
+            synonyms=("I-PERSON",),
         ),
         LabelConfig(
             name="B-ORG",
-            synonyms=[
+            synonyms=(
                 "B-ORGANIZATION",
                 "B-ORGANISATION",
                 "B-INST",
@@ -96,11 +96,11 @@ NER = TaskConfig(
                 "B-ORGOBJ",
                 "B-ORG_OBJ",
                 "B-ORG/OBJ",
-            ],
+            ),
         ),
         LabelConfig(
             name="I-ORG",
-            synonyms=[
+            synonyms=(
                 "I-ORGANIZATION",
                 "I-ORGANISATION",
                 "I-INST",
@@ -122,11 +122,11 @@ NER = TaskConfig(
                 "I-ORGOBJ",
                 "I-ORG_OBJ",
                 "I-ORG/OBJ",
-            ],
+            ),
         ),
         LabelConfig(
             name="B-LOC",
-            synonyms=[
+            synonyms=(
                 "B-LOCATION",
                 "B-PLACE",
                 "B-GPELOC",
@@ -147,11 +147,11 @@ NER = TaskConfig(
                 "B-PRSLOC",
                 "B-PRS_LOC",
                 "B-PRS/LOC",
-            ],
+            ),
         ),
         LabelConfig(
             name="I-LOC",
-            synonyms=[
+            synonyms=(
                 "I-LOCATION",
                 "I-PLACE",
                 "I-GPELOC",
@@ -172,18 +172,18 @@ NER = TaskConfig(
                 "I-PRSLOC",
                 "I-PRS_LOC",
                 "I-PRS/LOC",
-            ],
+            ),
         ),
         LabelConfig(
             name="B-MISC",
-            synonyms=["B-MISCELLANEOUS"],
+            synonyms=("B-MISCELLANEOUS",),
         ),
         LabelConfig(
             name="I-MISC",
-            synonyms=["I-MISCELLANEOUS"],
+            synonyms=("I-MISCELLANEOUS",),
         ),
-    ],
-    feature_column_names=["text"],
+    ),
+    feature_column_names=("text",),
     label_column_name="ner_tags",
     test_name="test",
 )
@@ -195,18 +195,18 @@ QA = TaskConfig(
     huggingface_subset="da",
     supertask="question-answering",
     modality=Modality("text"),
-    metrics=[EXACT_MATCH, QA_F1],
-    labels=[
+    metrics=(EXACT_MATCH, QA_F1),
+    labels=(
         LabelConfig(
             name="START_POSITIONS",
-            synonyms=["LABEL_0"],
+            synonyms=("LABEL_0",),
         ),
         LabelConfig(
             name="END_POSITIONS",
-            synonyms=["LABEL_1"],
+            synonyms=("LABEL_1",),
         ),
-    ],
-    feature_column_names=["question", "context"],
+    ),
+    feature_column_names=("question", "context"),
     label_column_name="answers",
     test_name="test",
 )
@@ -218,18 +218,18 @@ OFFENSIVE = TaskConfig(
     huggingface_subset=None,
     supertask="sequence-classification",
     modality=Modality("text"),
-    metrics=[MCC, MACRO_F1],
-    labels=[
+    metrics=(MCC, MACRO_F1),
+    labels=(
         LabelConfig(
             name="NOT_OFFENSIVE",
-            synonyms=["NOT", "NOT OFFENSIVE", "LABEL_0"],
+            synonyms=("NOT", "NOT OFFENSIVE", "LABEL_0"),
         ),
         LabelConfig(
             name="OFFENSIVE",
-            synonyms=["OFF", "LABEL_1"],
+            synonyms=("OFF", "LABEL_1"),
         ),
-    ],
-    feature_column_names=["text"],
+    ),
+    feature_column_names=("text",),
     label_column_name="label",
     test_name="test",
 )
@@ -239,23 +239,23 @@ ASR = TaskConfig(
     huggingface_id="mozilla-foundation/common_voice_11_0",
     huggingface_subset="da",
     supertask="automatic-speech-recognition",
-    architectures=[
+    architectures=(
         "wav2-vec2-for-c-t-c",
         "whisper-for-conditional-generation",
-    ],
+    ),
     modality=Modality("audio"),
-    metrics=[WER],
-    labels=[
+    metrics=(WER,),
+    labels=(
         LabelConfig(
             name="LABEL_0",
-            synonyms=[],
+            synonyms=(),
         ),
         LabelConfig(
             name="LABEL_1",
-            synonyms=[],
+            synonyms=(),
         ),
-    ],
-    feature_column_names=["audio"],
+    ),
+    feature_column_names=("audio",),
     label_column_name="sentence",
     test_name="test",
 )
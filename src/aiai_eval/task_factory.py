@@ -1,6 +1,6 @@
 """Factory that produces tasks from a task configuration."""
 
-from typing import Optional, Type, Union
+from typing import Dict, Optional, Type, Union
 
 from .config import EvaluationConfig, TaskConfig
 from .exceptions import InvalidTask
@@ -24,6 +24,10 @@ class TaskFactory:
     def __init__(self, evaluation_config: EvaluationConfig):
         self.evaluation_config = evaluation_config
 
+        # Initialise variable storing the tasks built so far, so that every task is
+        # only built once
+        self._tasks: Dict[TaskConfig, Task] = dict()
+
     def build_task(self, task_name_or_config: Union[str, TaskConfig]) -> Task:
         """Build a evaluation task from a configuration or a name.
 
@@ -46,6 +50,10 @@ class TaskFactory:
         else:
             task_config = task_name_or_config
 
+        # If the task has already been built then reuse it
+        if task_config in self._tasks:
+            return self._tasks[task_config]
+
         # Get the evaluation class based on the task
         evaluation_cls: Optional[Type[Task]] = get_class_by_name(
             [task_config.name, task_config.supertask]
@@ -57,5 +65,6 @@ class TaskFactory:
         task_obj = evaluation_cls(
             task_config=task_config, evaluation_config=self.evaluation_config
         )
+        self._tasks[task_config] = task_obj
 
         return task_obj
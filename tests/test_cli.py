@@ -1,7 +1,7 @@
 """Unit tests for the `cli` module."""
 
 import pytest
-from click.types import BOOL, STRING, Choice
+from click.types import BOOL, INT, STRING, Choice
 
 from aiai_eval.cli import evaluate
 
@@ -25,6 +25,9 @@ def test_cli_param_names(params):
         "raise_error_on_invalid_model",
         "cache_dir",
         "prefer_device",
+        "mixed_precision",
+        "spacy_num_processes",
+        "dataloader_num_workers",
         "architecture_fname",
         "weight_fname",
         "verbose",
@@ -44,6 +47,9 @@ def test_cli_param_types(params):
     assert params["raise_error_on_invalid_model"] == BOOL
     assert params["cache_dir"] == STRING
     assert isinstance(params["prefer_device"], Choice)
+    assert params["mixed_precision"] == BOOL
+    assert params["spacy_num_processes"] == INT
+    assert params["dataloader_num_workers"] == INT
     assert params["verbose"] == BOOL
     assert params["architecture_fname"] == STRING
     assert params["weight_fname"] == STRING
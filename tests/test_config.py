@@ -1,6 +1,9 @@
 """Unit tests for the `config` module."""
 
 import os
+import pickle
+from copy import deepcopy
+from dataclasses import replace
 
 import pytest
 
@@ -10,13 +13,16 @@ from aiai_eval.config import (
     MetricConfig,
     ModelConfig,
     TaskConfig,
+    get_id2label,
+    get_label2id,
+    get_label_synonyms,
 )
 from aiai_eval.enums import CountryCode, Device, Framework, Modality
 
 
 @pytest.fixture(scope="module")
 def label():
-    yield LabelConfig(name="label-name", synonyms=["synonym1", "synonym2"])
+    yield LabelConfig(name="label-name", synonyms=("synonym1", "synonym2"))
 
 
 class TestLabelConfig:
@@ -25,13 +31,29 @@ class TestLabelConfig:
 
     def test_attributes_correspond_to_arguments(self, label):
         assert label.name == "label-name"
-        assert label.synonyms == ["synonym1", "synonym2"]
+        assert label.synonyms == ("synonym1", "synonym2")
+
+    def test_label_has_no_instance_dict(self, label):
+        assert not hasattr(label, "__dict__")
+
+    def test_label_can_be_copied(self, label):
+        label_copy = deepcopy(label)
+        assert label_copy.name == label.name
+        assert label_copy.synonyms == label.synonyms
+
+    def test_label_is_compared_by_identity(self, label):
+        label_copy = LabelConfig(name=label.name, synonyms=label.synonyms)
+        assert label_copy != label
+        assert label == label
 
 
 class TestMetricConfig:
     def test_metric_config_is_object(self, metric_config):
         assert isinstance(metric_config, MetricConfig)
 
+    def test_metric_config_is_hashable(self, metric_config):
+        assert hash(metric_config) == hash(metric_config)
+
     def test_attributes_correspond_to_arguments(self, metric_config):
         assert metric_config.name == "metric-name"
         assert metric_config.pretty_name == "Metric name"
@@ -42,6 +64,23 @@ class TestMetricConfig:
     def test_default_value_of_compute_kwargs(self, metric_config):
         assert metric_config.compute_kwargs == dict()
 
+    def test_metric_config_can_be_copied(self, metric_config):
+        metric_config_copy = deepcopy(metric_config)
+        assert metric_config_copy.name == metric_config.name
+        assert metric_config_copy.compute_kwargs == metric_config.compute_kwargs
+
+    def test_metric_config_can_be_pickled(self):
+        metric_config = MetricConfig(
+            name="metric-name",
+            pretty_name="Metric name",
+            huggingface_id="metric-id",
+            results_key="metric-key",
+            postprocessing_fn=str,
+        )
+        metric_config_copy = pickle.loads(pickle.dumps(metric_config))
+        assert metric_config_copy.name == metric_config.name
+        assert metric_config_copy.compute_kwargs == dict()
+
 
 class TestTaskConfig:
     @pytest.fixture(scope="class")
@@ -51,11 +90,11 @@ class TestTaskConfig:
             huggingface_id="dataset-id",
             huggingface_subset=None,
             supertask="supertask-name",
-            architectures=["supertask-name"],
+            architectures=("supertask-name",),
             modality=Modality("text"),
-            metrics=[metric_config],
-            labels=[label],
-            feature_column_names=["column-name"],
+            metrics=(metric_config,),
+            labels=(label,),
+            feature_column_names=("column-name",),
             label_column_name="label",
             test_name="test",
         )
@@ -70,9 +109,9 @@ class TestTaskConfig:
         assert task_config.huggingface_id == "dataset-id"
         assert task_config.huggingface_subset is None
         assert task_config.supertask == "supertask-name"
-        assert task_config.metrics == [metric_config]
-        assert task_config.labels == [label]
-        assert task_config.feature_column_names == ["column-name"]
+        assert task_config.metrics == (metric_config,)
+        assert task_config.labels == (label,)
+        assert task_config.feature_column_names == ("column-name",)
         assert task_config.label_column_name == "label"
         assert task_config.test_name == "test"
 
@@ -80,7 +119,7 @@ class TestTaskConfig:
         assert task_config.pretty_name == "task name"
 
     def test_id2label(self, task_config, label):
-        assert task_config.id2label == [label.name]
+        assert task_config.id2label == (label.name,)
 
     def test_label2id(self, task_config, label):
         assert task_config.label2id == {
@@ -93,13 +132,75 @@ class TestTaskConfig:
         assert task_config.num_labels == 1
 
     def test_label_synonyms(self, task_config, label):
-        assert task_config.label_synonyms == [
-            [
+        assert task_config.label_synonyms == (
+            (
                 label.name,
                 label.synonyms[0],
                 label.synonyms[1],
-            ]
-        ]
+            ),
+        )
+
+    def test_task_config_can_be_copied(self, task_config):
+        task_config_copy = deepcopy(task_config)
+        assert task_config_copy.name == task_config.name
+        assert task_config_copy.id2label == task_config.id2label
+        assert task_config_copy.label2id == task_config.label2id
+
+    def test_task_config_can_be_pickled(self, label):
+        metric_config = MetricConfig(
+            name="metric-name",
+            pretty_name="Metric name",
+            huggingface_id="metric-id",
+            results_key="metric-key",
+            postprocessing_fn=str,
+        )
+        task_config = TaskConfig(
+            name="task-name",
+            huggingface_id="dataset-id",
+            huggingface_subset=None,
+            supertask="supertask-name",
+            modality=Modality("text"),
+            metrics=(metric_config,),
+            labels=(label,),
+            feature_column_names=("column-name",),
+            label_column_name="label",
+            test_name="test",
+        )
+        task_config_copy = pickle.loads(pickle.dumps(task_config))
+        assert task_config_copy.name == task_config.name
+        assert task_config_copy.architectures == task_config.architectures
+        assert task_config_copy.id2label == task_config.id2label
+        assert task_config_copy.label2id == task_config.label2id
+
+    def test_label_conversions_are_shared_with_same_labels(self, task_config):
+        other_task_config = replace(task_config, name="other-task-name")
+        assert other_task_config.id2label is task_config.id2label
+        assert other_task_config.label2id is task_config.label2id
+        assert other_task_config.label_synonyms is task_config.label_synonyms
+
+
+class TestLabelConversions:
+    def test_id2label(self, label):
+        assert get_id2label(labels=(label,)) == (label.name,)
+
+    def test_label2id(self, label):
+        assert get_label2id(labels=(label,)) == {
+            label.name: 0,
+            label.synonyms[0]: 0,
+            label.synonyms[1]: 0,
+        }
+
+    def test_label_synonyms(self, label):
+        assert get_label_synonyms(labels=(label,)) == (
+            (label.name, label.synonyms[0], label.synonyms[1]),
+        )
+
+    def test_label2id_is_read_only(self, label):
+        with pytest.raises(TypeError):
+            get_label2id(labels=(label,))["new-label"] = 1
+
+    def test_conversions_are_shared_between_identical_labels(self, label):
+        assert get_label2id(labels=(label,)) is get_label2id(labels=(label,))
 
 
 class TestEvaluationConfig:
@@ -118,6 +219,9 @@ class TestEvaluationConfig:
         assert evaluation_config.country_code == CountryCode.DNK
         assert evaluation_config.prefer_device == Device.CPU
         assert evaluation_config.only_return_log is False
+        assert evaluation_config.mixed_precision is False
+        assert evaluation_config.spacy_num_processes == 1
+        assert evaluation_config.dataloader_num_workers == 0
         assert evaluation_config.testing is True
 
     def test_device(self, evaluation_config):
@@ -20,6 +20,9 @@ def evaluator(evaluation_config):
         country_code=evaluation_config.country_code,
         prefer_device=evaluation_config.prefer_device,
         only_return_log=evaluation_config.only_return_log,
+        mixed_precision=evaluation_config.mixed_precision,
+        spacy_num_processes=evaluation_config.spacy_num_processes,
+        dataloader_num_workers=evaluation_config.dataloader_num_workers,
         verbose=evaluation_config.verbose,
     )
     evaluator.evaluation_config.testing = True
@@ -1,6 +1,7 @@
 """Unit tests for the `hf_hub_utils` module."""
 
 from copy import deepcopy
+from dataclasses import replace
 
 import pytest
 from huggingface_hub.hf_api import ModelInfo
@@ -29,8 +30,9 @@ class TestLoadModelFromHfHub:
             framework=Framework.PYTORCH,
             id2label=None,
         )
-        task_config_copy = deepcopy(task_config)
-        task_config_copy.supertask = "wav-2-vec-2-for-c-t-c"
+        task_config_copy = replace(
+            deepcopy(task_config), supertask="wav-2-vec-2-for-c-t-c"
+        )
         with pytest.raises(InvalidEvaluation):
             load_model_from_hf_hub(
                 model_config=model_config,
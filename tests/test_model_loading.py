@@ -1,6 +1,6 @@
 """Unit tests for the `model_loading` module."""
 
-from copy import deepcopy
+from dataclasses import replace
 
 import pytest
 
@@ -24,8 +24,7 @@ class TestLoadModel:
         self, model_configs, task_config, evaluation_config
     ):
         for model_config in model_configs:
-            model_config_copy = deepcopy(model_config)
-            model_config_copy.framework = "invalid-framework"
+            model_config_copy = replace(model_config, framework="invalid-framework")
             with pytest.raises(InvalidFramework):
                 load_model(
                     model_config=model_config_copy,
@@ -4,12 +4,16 @@ from functools import partial
 
 import numpy as np
 import pytest
+import spacy
 from datasets.load import load_dataset
 from transformers.data.data_collator import DataCollatorForTokenClassification
 from transformers.models.auto.tokenization_auto import AutoTokenizer
+from transformers.models.bert import BertTokenizer, BertTokenizerFast
 
+from aiai_eval.exceptions import MissingLabel
 from aiai_eval.named_entity_recognition import (
     NamedEntityRecognition,
+    remove_ignored_index_from_predictions_and_labels,
     tokenize_and_align_labels,
 )
 from aiai_eval.task_configs import NER
@@ -44,9 +48,7 @@ class TestTokenizeAndAlignLabels:
                 dataset_id2label=ner.task_config.id2label,
                 label_column_name=ner.task_config.label_column_name,
             )
-            tokenised_dataset = dataset.map(
-                map_fn, batched=True, load_from_cache_file=False
-            )
+            tokenised_dataset = dataset.with_transform(map_fn)
             all_datasets.append(tokenised_dataset)
             return all_datasets
         else:
@@ -60,23 +62,118 @@ class TestTokenizeAndAlignLabels:
     def test_tokenize_and_align_labels_columns(self, tokenised_datasets):
         if tokenised_datasets is not None:
             for tokenised_dataset in tokenised_datasets:
-                assert set(tokenised_dataset.features.keys()) == {
-                    "text",
-                    "ner_tags",
+                assert set(tokenised_dataset[0:2].keys()) == {
                     "input_ids",
                     "token_type_ids",
                     "attention_mask",
-                    "tokens",
-                    "lemmas",
-                    "sent_id",
-                    "tok_ids",
-                    "pos_tags",
-                    "morph_tags",
-                    "dep_ids",
-                    "dep_labels",
                     "labels",
                 }
 
+    def test_labels_are_aligned_with_tokens(self, tokenised_datasets):
+        if tokenised_datasets is not None:
+            for tokenised_dataset in tokenised_datasets:
+                batch = tokenised_dataset[0:2]
+                for input_ids, labels in zip(batch["input_ids"], batch["labels"]):
+                    assert len(input_ids) == len(labels)
+
+
+class TestAlignedLabels:
+    @pytest.fixture(scope="class")
+    def vocab_file(self, tmp_path_factory):
+        vocab = [
+            "[PAD]",
+            "[UNK]",
+            "[CLS]",
+            "[SEP]",
+            "[MASK]",
+            "Hans",
+            "Ander",
+            "##sen",
+            "bo",
+            "##ede",
+            "i",
+            "Odense",
+        ]
+        vocab_file = tmp_path_factory.mktemp("tokenizer") / "vocab.txt"
+        vocab_file.write_text("\n".join(vocab))
+        yield str(vocab_file)
+
+    @pytest.fixture(
+        scope="class", params=[BertTokenizerFast, BertTokenizer], ids=["fast", "slow"]
+    )
+    def tokenizer_class(self, request):
+        yield request.param
+
+    @pytest.fixture(scope="class")
+    def examples(self):
+        tags = ["B-PER", "I-PER", "O", "O", "B-LOC"]
+        yield dict(
+            tokens=[["Hans", "Andersen", "boede", "i", "Odense"]],
+            ner_tags=[[NER.label2id[tag] for tag in tags]],
+        )
+
+    @pytest.fixture(scope="class")
+    def model_label2id(self):
+        yield {"B-LOC": 0, "B-PER": 1, "I-PER": 2, "O": 3}
+
+    def align_labels(self, examples, tokenizer, model_label2id):
+        return tokenize_and_align_labels(
+            examples=examples,
+            tokenizer=tokenizer,
+            model_label2id=model_label2id,
+            dataset_id2label=NER.id2label,
+            label_column_name=NER.label_column_name,
+        )["labels"]
+
+    def test_only_first_token_of_each_word_is_labelled(
+        self, vocab_file, tokenizer_class, examples, model_label2id
+    ):
+        tokenizer = tokenizer_class(vocab_file=vocab_file, do_lower_case=False)
+        labels = self.align_labels(
+            examples=examples, tokenizer=tokenizer, model_label2id=model_label2id
+        )
+
+        # The tokens are [CLS], Hans, Ander, ##sen, bo, ##ede, i, Odense, [SEP]
+        assert labels == [[-100, 1, 2, -100, 3, -100, 3, 0, -100]]
+
+    def test_truncated_examples_are_labelled(
+        self, vocab_file, examples, model_label2id
+    ):
+        tokenizer = BertTokenizerFast(
+            vocab_file=vocab_file, do_lower_case=False, model_max_length=5
+        )
+        labels = self.align_labels(
+            examples=examples, tokenizer=tokenizer, model_label2id=model_label2id
+        )
+
+        # The tokens are [CLS], Hans, Ander, ##sen, [SEP]
+        assert labels == [[-100, 1, 2, -100, -100]]
+
+    def test_examples_are_labelled_separately(
+        self, vocab_file, tokenizer_class, examples, model_label2id
+    ):
+        tokenizer = tokenizer_class(vocab_file=vocab_file, do_lower_case=False)
+        batch = dict(
+            tokens=examples["tokens"] + [["Odense"]],
+            ner_tags=examples["ner_tags"] + [[NER.label2id["B-LOC"]]],
+        )
+        labels = self.align_labels(
+            examples=batch, tokenizer=tokenizer, model_label2id=model_label2id
+        )
+        assert labels == [[-100, 1, 2, -100, 3, -100, 3, 0, -100], [-100, 0, -100]]
+
+    def test_raise_error_if_label_is_missing(
+        self, vocab_file, tokenizer_class, examples, model_label2id
+    ):
+        tokenizer = tokenizer_class(vocab_file=vocab_file, do_lower_case=False)
+        model_label2id = {
+            label: idx for label, idx in model_label2id.items() if label != "B-LOC"
+        }
+        with pytest.raises(MissingLabel):
+            self.align_labels(
+                examples=examples, tokenizer=tokenizer, model_label2id=model_label2id
+            )
+
 
 class TestLoadDataCollator:
     @pytest.fixture(scope="class")
@@ -90,6 +187,63 @@ class TestLoadDataCollator:
         assert data_collator.label_pad_token_id == -100
 
 
+def test_get_unused_spacy_components(ner):
+    model = spacy.blank("da")
+    model.add_pipe("tok2vec", name="embeddings")
+    model.add_pipe("tagger")
+    model.add_pipe("parser")
+    model.add_pipe("attribute_ruler")
+    model.add_pipe("entity_ruler")
+    model.add_pipe("ner", name="custom_ner")
+    assert ner._get_unused_spacy_components(model=model) == [
+        "tagger",
+        "parser",
+        "attribute_ruler",
+    ]
+
+
+class TestRemoveIgnoredIndexFromPredictionsAndLabels:
+    @pytest.fixture(scope="class")
+    def model_id2label(self):
+        yield ["O", "B-PER", "I-PER", "B-LOC"]
+
+    @pytest.fixture(scope="class")
+    def labels(self):
+        yield [[-100, 1, 2, -100, 0, -100], [-100, 3, 0, -100]]
+
+    def test_predictions_and_labels_are_converted(self, model_id2label, labels):
+        predictions = [[0, 1, 2, 2, 0, 0], np.array([0, 3, 1, 0])]
+        predictions, labels = remove_ignored_index_from_predictions_and_labels(
+            predictions=predictions, labels=labels, model_id2label=model_id2label
+        )
+        assert predictions == [["B-PER", "I-PER", "O"], ["B-LOC", "B-PER"]]
+        assert labels == [["B-PER", "I-PER", "O"], ["B-LOC", "O"]]
+
+    def test_padded_predictions_are_truncated(self, model_id2label, labels):
+        predictions = [[0, 1, 2, 2, 0, 0, 3, 3], [0, 3, 1, 0, 3, 3, 3, 3]]
+        predictions, _ = remove_ignored_index_from_predictions_and_labels(
+            predictions=predictions, labels=labels, model_id2label=model_id2label
+        )
+        assert predictions == [["B-PER", "I-PER", "O"], ["B-LOC", "B-PER"]]
+
+    def test_tag_predictions_are_kept(self, model_id2label, labels):
+        predictions = [
+            ["O", "B-PER", "I-PER", "O", "B-MISC", "O"],
+            [0, 3, 1, 0],
+        ]
+        predictions, _ = remove_ignored_index_from_predictions_and_labels(
+            predictions=predictions, labels=labels, model_id2label=model_id2label
+        )
+        assert predictions == [["B-PER", "I-PER", "B-MISC"], ["B-LOC", "B-PER"]]
+
+    def test_nothing_is_removed_without_id2label(self, labels):
+        predictions = [["O", "B-PER"], ["B-LOC"]]
+        output = remove_ignored_index_from_predictions_and_labels(
+            predictions=predictions, labels=labels, model_id2label=None
+        )
+        assert output == (predictions, labels)
+
+
 def test_compute_metrics(ner):
 
     # Define predictions and labels
@@ -102,10 +256,9 @@ def test_compute_metrics(ner):
         ["B-PER", "I-PER", "O"],
     ]
 
-    # Set up predictions and labels as arrays
-    predictions_and_labels = [
-        (np.asarray(predictions), np.array(labels)),
-    ]
+    # Set up predictions and labels as lists of tag lists, which is what
+    # `_prepare_predictions_and_labels` outputs
+    predictions_and_labels = [(predictions, labels)]
 
     # Compute metrics
     metrics = ner._compute_metrics(
@@ -72,7 +72,7 @@ def features_per_example(dataset, prepared_dataset):
     ids=["list-predictions", "array-predictions"],
 )
 def predictions(qa, model_dict, request, prepared_dataset):
-    list_predictions = qa._get_model_predictions(
+    model_predictions = qa._get_model_predictions(
         model=model_dict["model"],
         tokenizer=model_dict["tokenizer"],
         processor=model_dict["processor"],
@@ -81,9 +81,9 @@ def predictions(qa, model_dict, request, prepared_dataset):
         framework=Framework.PYTORCH,
     )
     if request.param:
-        return list_predictions
+        return list(model_predictions)
     else:
-        return np.array(list_predictions)
+        return np.asarray(model_predictions)
 
 
 class TestPrepareTestExamples:
@@ -100,6 +100,23 @@ class TestPrepareTestExamples:
         assert "offset_mapping" in prepared_dataset.features
 
 
+class TestGetFeatureIndices:
+    @pytest.fixture(scope="class")
+    def feature_indices(self, qa, dataset, prepared_dataset):
+        yield qa._get_feature_indices(
+            dataset=dataset, prepared_dataset=prepared_dataset
+        )
+
+    def test_feature_indices_length(self, feature_indices, dataset):
+        assert len(feature_indices) == len(dataset)
+
+    def test_feature_indices_match_features_per_example(
+        self, feature_indices, features_per_example
+    ):
+        for example_idx, indices in enumerate(feature_indices):
+            assert indices == features_per_example[example_idx]
+
+
 class TestPostprocessPredictions:
     @pytest.fixture(scope="class")
     def postprocessed_predictions(
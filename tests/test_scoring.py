@@ -48,6 +48,37 @@ class TestLogScores:
             assert isinstance(val, float)
 
 
+class TestLogAggregatedScores:
+    @pytest.fixture(scope="class")
+    def aggregated_scores(self, metric_config):
+        yield {metric_config.name: 0.42}
+
+    def test_aggregated_scores_have_no_standard_error(
+        self, metric_config, scores, aggregated_scores
+    ):
+        logged_scores = log_scores(
+            task_name="task",
+            metric_configs=[metric_config],
+            scores=scores,
+            model_id="model_id",
+            aggregated_scores=aggregated_scores,
+        )
+        assert logged_scores["total"] == aggregated_scores
+
+    def test_aggregated_scores_are_logged_without_standard_error(
+        self, metric_config, scores, aggregated_scores
+    ):
+        log = log_scores(
+            task_name="task",
+            metric_configs=[metric_config],
+            scores=scores,
+            model_id="model_id",
+            only_return_log=True,
+            aggregated_scores=aggregated_scores,
+        )
+        assert log == f"{metric_config.pretty_name}:\n↳  0.42"
+
+
 class TestAggregateScores:
     def test_scores(self, scores, metric_config):
         # Aggregate scores using the `agg_scores` function
@@ -5,7 +5,11 @@ import pytest
 from datasets import load_dataset
 from transformers import AutoConfig, AutoTokenizer, DataCollatorWithPadding
 
-from aiai_eval.sequence_classification import SequenceClassification
+from aiai_eval.exceptions import MissingLabel
+from aiai_eval.sequence_classification import (
+    SequenceClassification,
+    tokenize_and_numericalize,
+)
 from aiai_eval.task_configs import SENT
 
 
@@ -42,6 +46,47 @@ class TestLoadDataCollator:
     def test_padding_is_longest(self, data_collator):
         assert data_collator.padding == "longest"
 
+    def test_padding_is_multiple_of_eight(self, data_collator):
+        assert data_collator.pad_to_multiple_of == 8
+
+
+class TestTokenizeAndNumericalize:
+    @pytest.fixture(scope="class")
+    def examples(self):
+        yield dict(
+            text=["Godt", "Skidt", "Fint", "Okay"],
+            label=["positive", "negative", "positive", "neutral"],
+        )
+
+    def numericalize(self, examples, tokenizer, model_label2id):
+        return tokenize_and_numericalize(
+            examples=examples,
+            tokenizer=tokenizer,
+            feature_column_names=["text"],
+            label_column_name="label",
+            model_label2id=model_label2id,
+        )
+
+    def test_labels_are_numericalized(self, examples, tokenizer):
+        numericalized = self.numericalize(
+            examples=examples,
+            tokenizer=tokenizer,
+            model_label2id=dict(POSITIVE=0, NEGATIVE=1, NEUTRAL=2),
+        )
+        assert numericalized["labels"] == [0, 1, 0, 2]
+
+    def test_first_missing_label_is_reported(self, tokenizer):
+        examples = dict(
+            text=["Godt", "Okay", "Skidt"], label=["positive", "neutral", "negative"]
+        )
+        with pytest.raises(MissingLabel) as exc_info:
+            self.numericalize(
+                examples=examples,
+                tokenizer=tokenizer,
+                model_label2id=dict(POSITIVE=0),
+            )
+        assert exc_info.value.label == "NEUTRAL"
+
 
 def test_compute_metrics(seq_clf):
 
@@ -1,13 +1,18 @@
 """Unit tests for the `task` module."""
 
+from dataclasses import replace
 from typing import List, Sequence, Tuple
 
+import datasets
 import pytest
+import transformers
 from datasets.arrow_dataset import Dataset
 from evaluate import EvaluationModule
+from transformers import AutoTokenizer
 from transformers.tokenization_utils_base import BatchEncoding, PreTrainedTokenizerBase
 
-from aiai_eval.config import TaskConfig
+from aiai_eval.config import LabelConfig, ModelConfig, TaskConfig
+from aiai_eval.enums import Framework
 from aiai_eval.task import Task
 
 
@@ -68,6 +73,193 @@ class TestTaskAttributes:
         for metric in metrics.values():
             assert isinstance(metric, EvaluationModule)
 
+    def test_metrics_are_shared_between_tasks(self, task, evaluation_config):
+        other_task = TaskDummy(
+            task_config=task.task_config, evaluation_config=evaluation_config
+        )
+        for name, metric in task._metrics.items():
+            assert other_task._metrics[name] is metric
+
+
+class TestGetFeatureIndices:
+    def test_every_example_has_a_single_feature(self, task):
+        dataset = Dataset.from_dict(dict(text=["a", "b", "c"]))
+        feature_indices = task._get_feature_indices(
+            dataset=dataset, prepared_dataset=dataset
+        )
+        assert feature_indices == [[0], [1], [2]]
+
+
+class TestGetDataloaderKwargs:
+    def test_no_workers_by_default(self, task):
+        assert task._get_dataloader_kwargs() == dict()
+
+    def test_no_workers_when_testing(self, task_config, evaluation_config):
+        evaluation_config = replace(evaluation_config, dataloader_num_workers=4)
+        task = TaskDummy(task_config=task_config, evaluation_config=evaluation_config)
+        assert task._get_dataloader_kwargs() == dict()
+
+    def test_workers_are_used(self, task_config, evaluation_config):
+        evaluation_config = replace(
+            evaluation_config, dataloader_num_workers=4, testing=False
+        )
+        task = TaskDummy(task_config=task_config, evaluation_config=evaluation_config)
+        kwargs = task._get_dataloader_kwargs()
+        assert kwargs["num_workers"] == 4
+        assert kwargs["pin_memory"] == (evaluation_config.device == "cuda")
+
+
+class TestGetPreprocessingFingerprint:
+    @pytest.fixture(scope="class")
+    def dataset(self):
+        yield Dataset.from_dict(dict(text=["a", "b", "c"]))
+
+    @pytest.fixture(scope="class")
+    def tokenizer(self):
+        yield AutoTokenizer.from_pretrained("pin/senda")
+
+    @pytest.fixture(scope="class")
+    def model_config(self):
+        yield ModelConfig(
+            model_id="pin/senda",
+            tokenizer_id="pin/senda",
+            processor_id=None,
+            revision="main",
+            framework=Framework.PYTORCH,
+            id2label=["NEGATIVE", "POSITIVE"],
+            label2id=dict(NEGATIVE=0, POSITIVE=1),
+        )
+
+    @pytest.fixture(scope="class")
+    def fingerprint(self, task, dataset, tokenizer, model_config):
+        yield task._get_preprocessing_fingerprint(
+            dataset=dataset, tokenizer=tokenizer, model_config=model_config
+        )
+
+    def test_fingerprint_is_deterministic(
+        self, task, dataset, tokenizer, model_config, fingerprint
+    ):
+        assert fingerprint == task._get_preprocessing_fingerprint(
+            dataset=dataset, tokenizer=tokenizer, model_config=replace(model_config)
+        )
+
+    def test_fingerprint_depends_on_tokenizer(
+        self, task, dataset, model_config, fingerprint
+    ):
+        other_tokenizer = AutoTokenizer.from_pretrained("pin/senda", model_max_length=8)
+        assert fingerprint != task._get_preprocessing_fingerprint(
+            dataset=dataset, tokenizer=other_tokenizer, model_config=model_config
+        )
+
+    def test_fingerprint_depends_on_tokenizer_settings(
+        self, task, dataset, model_config
+    ):
+        cased_tokenizer = AutoTokenizer.from_pretrained(
+            "pin/senda", do_lower_case=False
+        )
+        uncased_tokenizer = AutoTokenizer.from_pretrained(
+            "pin/senda", do_lower_case=True
+        )
+        assert task._get_preprocessing_fingerprint(
+            dataset=dataset, tokenizer=cased_tokenizer, model_config=model_config
+        ) != task._get_preprocessing_fingerprint(
+            dataset=dataset, tokenizer=uncased_tokenizer, model_config=model_config
+        )
+
+    def test_fingerprint_depends_on_labels(
+        self, task, evaluation_config, dataset, tokenizer, model_config, fingerprint
+    ):
+        other_task_config = replace(
+            task.task_config,
+            labels=task.task_config.labels + (LabelConfig("EXTRA-LABEL", ()),),
+        )
+        other_task = TaskDummy(
+            task_config=other_task_config, evaluation_config=evaluation_config
+        )
+        assert fingerprint != other_task._get_preprocessing_fingerprint(
+            dataset=dataset, tokenizer=tokenizer, model_config=model_config
+        )
+
+    def test_fingerprint_depends_on_label_synonyms(
+        self, task, evaluation_config, dataset, tokenizer, model_config
+    ):
+        fingerprints = list()
+        for synonyms in [(), ("EXTRA-SYNONYM",)]:
+            other_task_config = replace(
+                task.task_config,
+                labels=task.task_config.labels
+                + (LabelConfig("EXTRA-LABEL", synonyms),),
+            )
+            other_task = TaskDummy(
+                task_config=other_task_config, evaluation_config=evaluation_config
+            )
+            fingerprints.append(
+                other_task._get_preprocessing_fingerprint(
+                    dataset=dataset, tokenizer=tokenizer, model_config=model_config
+                )
+            )
+        assert fingerprints[0] != fingerprints[1]
+
+    @pytest.mark.parametrize(
+        argnames="field_name,value",
+        argvalues=[
+            ("label_column_name", "other-label-column"),
+            ("feature_column_names", ("other-feature-column",)),
+        ],
+    )
+    def test_fingerprint_depends_on_column_names(
+        self,
+        task,
+        evaluation_config,
+        dataset,
+        tokenizer,
+        model_config,
+        fingerprint,
+        field_name,
+        value,
+    ):
+        other_task_config = replace(task.task_config, **{field_name: value})
+        other_task = TaskDummy(
+            task_config=other_task_config, evaluation_config=evaluation_config
+        )
+        assert fingerprint != other_task._get_preprocessing_fingerprint(
+            dataset=dataset, tokenizer=tokenizer, model_config=model_config
+        )
+
+    @pytest.mark.parametrize(argnames="library", argvalues=[transformers, datasets])
+    def test_fingerprint_depends_on_library_versions(
+        self,
+        task,
+        dataset,
+        tokenizer,
+        model_config,
+        fingerprint,
+        library,
+        monkeypatch,
+    ):
+        monkeypatch.setattr(library, "__version__", "0.0.0")
+        assert fingerprint != task._get_preprocessing_fingerprint(
+            dataset=dataset, tokenizer=tokenizer, model_config=model_config
+        )
+
+    def test_fingerprint_depends_on_revision(
+        self, task, dataset, tokenizer, model_config, fingerprint
+    ):
+        other_model_config = replace(model_config, revision="other-revision")
+        assert fingerprint != task._get_preprocessing_fingerprint(
+            dataset=dataset, tokenizer=tokenizer, model_config=other_model_config
+        )
+
+    def test_fingerprint_depends_on_label2id(
+        self, task, dataset, tokenizer, model_config, fingerprint
+    ):
+        other_model_config = replace(
+            model_config, label2id=dict(NEGATIVE=1, POSITIVE=0)
+        )
+        assert fingerprint != task._get_preprocessing_fingerprint(
+            dataset=dataset, tokenizer=tokenizer, model_config=other_model_config
+        )
+
 
 class TestLoadData:
     @pytest.fixture(scope="class")
@@ -1,6 +1,7 @@
 """Unit tests for the `task_factory` module."""
 
 from copy import deepcopy
+from dataclasses import replace
 
 import pytest
 
@@ -12,7 +13,7 @@ from aiai_eval.utils import kebab_to_pascal
 
 @pytest.fixture(scope="module")
 def label():
-    yield LabelConfig(name="label_name", synonyms=["synonym1", "synonym2"])
+    yield LabelConfig(name="label_name", synonyms=("synonym1", "synonym2"))
 
 
 @pytest.fixture(scope="module")
@@ -30,6 +31,11 @@ def test_configs_are_preserved(task_config, task_factory, evaluation_config):
     assert task.task_config == task_config
 
 
+def test_tasks_are_only_built_once(task_config, task_factory):
+    task = task_factory.build_task(task_name_or_config=task_config)
+    assert task_factory.build_task(task_name_or_config=task_config) is task
+
+
 def test_build_task(task_config, task_factory):
     task = task_factory.build_task(task_name_or_config=task_config)
     assert type(task).__name__ in [
@@ -39,8 +45,8 @@ def test_build_task(task_config, task_factory):
 
 
 def test_raise_error_if_unknown_task(task_config, task_factory):
-    task_config_copy = deepcopy(task_config)
-    task_config_copy.name = "unknown-task"
-    task_config_copy.supertask = "unknown-supertask"
+    task_config_copy = replace(
+        deepcopy(task_config), name="unknown-task", supertask="unknown-supertask"
+    )
     with pytest.raises(InvalidTask):
         task_factory.build_task(task_name_or_config=task_config_copy)